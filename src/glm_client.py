@@ -6,13 +6,40 @@ import os
 import json
 import re
 import time
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 
 import requests
 
+# Optional async HTTP client for concurrent extraction
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
+# Extraction prompt. SYSTEM_PROMPT is sent byte-for-byte identical on every call so the
+# provider's prompt (prefix) cache can reuse it; only the short user message varies.
+SYSTEM_PROMPT = (
+    "你是一个科学文献分析助手。请从摘要中提取以下信息，并输出严格的一个JSON对象，包含以下键：\n"
+    "- what_done: 这篇论文做了什么（详细描述研究内容、研究方法、研究目标、实验设计、主要发现等，要求详细且完整，尽量包含研究的关键步骤和主要结果，字数控制在300-500字）\n"
+    "- ai_role: 用AI做了什么（AI在研究中扮演的角色、具体应用场景、如何使用AI解决问题等，要求详细说明AI的具体作用和应用方式，字数控制在200-300字）\n"
+    "- models: 用了哪个模型（模型名称、算法类型、架构等，用英文原名称）\n"
+    "- data_sources: 数据资源（数据集来源、数据规模、数据类型等，详细描述）\n"
+    "- metrics: 评估指标（可选，如果有的话）\n"
+    "重要要求：\n"
+    "1. what_done 和 ai_role 必须用中文回答，内容要详细和完整\n"
+    "2. models 和 data_sources 可以用英文（如果是专有名词），也可以中英结合\n"
+    "3. 所有内容要准确反映摘要中的信息，不要编造\n"
+    "4. 如果某个字段找不到，设置为空字符串"
+)
+USER_TEMPLATE = '摘要：\n"""\n{abstract}\n"""\n\n请从上述摘要中提取信息，用中文详细描述研究内容和AI应用。只返回JSON对象，不要其他文字。'
+
+# Responses worth retrying with backoff (rate limiting and server errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 class GLMClient:
     """Client for interacting with BigModel GLM API."""
@@ -46,7 +73,8 @@ class GLMClient:
         messages: list,
         temperature: float = 0.0,
         max_retries: int = 5,
-        initial_delay: float = 1.0
+        initial_delay: float = 1.0,
+        max_tokens: int = 3000
     ) -> Dict[str, Any]:
         """
         Make a request to the GLM API with exponential backoff retry.
@@ -56,6 +84,7 @@ class GLMClient:
             temperature: Sampling temperature (0 for deterministic)
             max_retries: Maximum number of retry attempts
             initial_delay: Initial delay in seconds before first retry
+            max_tokens: Maximum completion tokens
             
         Returns:
             API response as dict
@@ -73,7 +102,7 @@ class GLMClient:
             'model': self.model_name,
             'messages': messages,
             'temperature': temperature,
-            'max_tokens': 3000,  # 增加token限制以支持更详细的中文内容
+            'max_tokens': max_tokens,  # 默认3000，支持更详细的中文内容
         }
         
         delay = initial_delay
@@ -93,7 +122,7 @@ class GLMClient:
                     return response.json()
                 
                 # Handle rate limiting and server errors with retry
-                if response.status_code in [429, 500, 502, 503, 504]:
+                if response.status_code in RETRY_STATUSES:
                     logger.warning(
                         f"GLM API returned {response.status_code}, retrying after {delay}s"
                     )
@@ -134,49 +163,151 @@ class GLMClient:
         Raises:
             Exception: If extraction fails
         """
-        if system_prompt is None:
-            system_prompt = (
-                "你是一个科学文献分析助手。请从摘要中提取以下信息，并输出严格的一个JSON对象，包含以下键：\n"
-                "- what_done: 这篇论文做了什么（详细描述研究内容、研究方法、研究目标、实验设计、主要发现等，要求详细且完整，尽量包含研究的关键步骤和主要结果，字数控制在300-500字）\n"
-                "- ai_role: 用AI做了什么（AI在研究中扮演的角色、具体应用场景、如何使用AI解决问题等，要求详细说明AI的具体作用和应用方式，字数控制在200-300字）\n"
-                "- models: 用了哪个模型（模型名称、算法类型、架构等，用英文原名称）\n"
-                "- data_sources: 数据资源（数据集来源、数据规模、数据类型等，详细描述）\n"
-                "- metrics: 评估指标（可选，如果有的话）\n"
-                "重要要求：\n"
-                "1. what_done 和 ai_role 必须用中文回答，内容要详细和完整\n"
-                "2. models 和 data_sources 可以用英文（如果是专有名词），也可以中英结合\n"
-                "3. 所有内容要准确反映摘要中的信息，不要编造\n"
-                "4. 如果某个字段找不到，设置为空字符串"
-            )
-        
-        user_prompt = f'摘要：\n"""\n{abstract}\n"""\n\n请从上述摘要中提取信息，用中文详细描述研究内容和AI应用。只返回JSON对象，不要其他文字。'
-        
-        messages = [
-            {'role': 'system', 'content': system_prompt},
-            {'role': 'user', 'content': user_prompt}
-        ]
+        messages = self._build_messages(abstract, system_prompt)
         
         try:
             response = self._make_request(messages, temperature=0.0)
+            return self._parse_completion(response)
             
-            # Extract content from response
-            if 'choices' in response and len(response['choices']) > 0:
-                content = response['choices'][0].get('message', {}).get('content', '')
-            else:
-                raise ValueError("Invalid response format from GLM API")
+        except Exception as e:
+            logger.error(f"GLM extraction failed: {e}")
+            raise
+    
+    async def _make_request_async(
+        self,
+        session: "aiohttp.ClientSession",
+        messages: list,
+        temperature: float = 0.0,
+        max_retries: int = 5,
+        initial_delay: float = 1.0,
+        max_tokens: int = 3000
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of _make_request over a shared aiohttp session.
+        
+        Args:
+            session: aiohttp session whose pooled connections are reused
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0 for deterministic)
+            max_retries: Maximum number of retry attempts
+            initial_delay: Initial delay in seconds before first retry
+            max_tokens: Maximum completion tokens
             
-            # Try to parse JSON
-            result = self._parse_json_response(content)
+        Returns:
+            API response as dict
+            
+        Raises:
+            Exception: If all retries fail
+        """
+        url = f"{self.base_url}/chat/completions"
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+        
+        payload = {
+            'model': self.model_name,
+            'messages': messages,
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+        }
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        delay = initial_delay
+        last_exception = None
+        
+        for attempt in range(max_retries):
+            try:
+                logger.debug(f"GLM API async request attempt {attempt + 1}/{max_retries}")
+                async with session.post(url, headers=headers, json=payload, timeout=timeout) as response:
+                    if response.status == 200:
+                        return await response.json(content_type=None)
+                    status = response.status
+                    if status not in RETRY_STATUSES or attempt == max_retries - 1:
+                        response.raise_for_status()
+                
+                # Rate limiting and server errors: back off without holding the connection
+                logger.warning(f"GLM API returned {status}, retrying after {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 32)  # Exponential backoff, max 32s
+                
+            except aiohttp.ClientResponseError as e:
+                # For other errors (e.g. 401, 400), raise immediately; a retryable
+                # status only gets here once the retries are used up
+                if e.status not in RETRY_STATUSES:
+                    raise
+                raise Exception(f"GLM API request failed after {max_retries} attempts") from e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exception = e
+                logger.warning(f"GLM API request failed: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 32)
+                else:
+                    raise Exception(f"GLM API request failed after {max_retries} attempts") from e
+        
+        raise Exception(f"GLM API request failed after {max_retries} attempts") from last_exception
+    
+    async def extract_structured_info_async(
+        self,
+        abstract: str,
+        session: Optional["aiohttp.ClientSession"] = None,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Async counterpart of extract_structured_info.
+        
+        Args:
+            abstract: The abstract text to analyze
+            session: Shared aiohttp session; without one (or without aiohttp)
+                the blocking request runs in a worker thread
+            system_prompt: Optional custom system prompt
             
-            # Validate and truncate fields
-            validated_result = self._validate_extraction_result(result)
+        Returns:
+            Dictionary with extracted fields: what_done, ai_role, models, data_sources, metrics
             
-            return validated_result
+        Raises:
+            Exception: If extraction fails
+        """
+        if session is None or aiohttp is None:
+            return await asyncio.to_thread(self.extract_structured_info, abstract, system_prompt)
+        
+        messages = self._build_messages(abstract, system_prompt)
+        
+        try:
+            response = await self._make_request_async(session, messages, temperature=0.0)
+            return self._parse_completion(response)
             
         except Exception as e:
             logger.error(f"GLM extraction failed: {e}")
             raise
     
+    def _build_messages(self, abstract: str, system_prompt: Optional[str] = None) -> list:
+        """Chat messages for extracting one abstract."""
+        return [
+            {'role': 'system', 'content': system_prompt if system_prompt is not None else SYSTEM_PROMPT},
+            {'role': 'user', 'content': USER_TEMPLATE.format(abstract=abstract)}
+        ]
+    
+    def _parse_completion(self, response: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Turn a chat completion response into validated extraction fields.
+        
+        Args:
+            response: API response as dict
+            
+        Returns:
+            Validated result with all required fields
+        """
+        # Extract content from response
+        if 'choices' in response and len(response['choices']) > 0:
+            content = response['choices'][0].get('message', {}).get('content', '')
+        else:
+            raise ValueError("Invalid response format from GLM API")
+        
+        # Try to parse JSON
+        result = self._parse_json_response(content)
+        
+        # Validate and truncate fields
+        return self._validate_extraction_result(result)
+    
     def _parse_json_response(self, content: str) -> Dict[str, str]:
         """
         Parse JSON from response content, attempting to extract JSON block if needed.
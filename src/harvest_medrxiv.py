@@ -3,18 +3,28 @@ Main script for harvesting medRxiv articles related to AI.
 """
 import os
 import json
+import asyncio
 import logging
-import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
 try:
-    from src.fetch_articles import ArticleFetcher
-    from src.llm_extractor import LLMExtractor
+    from .fetch_articles import ArticleFetcher
+    from .llm_extractor import LLMExtractor
 except ImportError:
-    from fetch_articles import ArticleFetcher
-    from llm_extractor import LLMExtractor
+    try:
+        from src.fetch_articles import ArticleFetcher
+        from src.llm_extractor import LLMExtractor
+    except ImportError:
+        from fetch_articles import ArticleFetcher
+        from llm_extractor import LLMExtractor
+
+# Optional async HTTP client; without it GLM requests run in worker threads
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # Setup logging
 logging.basicConfig(
@@ -27,6 +37,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Markdown section for one article in the report
+ARTICLE_MD_TEMPLATE = (
+    "#### {i}. {title}.\n"
+    "\n"
+    "**Last Corresponding Author:** {author}\n"
+    "\n"
+    "{affiliation}"
+    "{published}"
+    "{url}"
+    "**Source:** {source}\n"
+    "\n"
+    "##### Extracted Information\n"
+    "\n"
+    "**What was done:** {what_done}\n"
+    "\n"
+    "**AI Role:** {ai_role}\n"
+    "\n"
+    "**Models:** {models}\n"
+    "\n"
+    "**Data Sources:** {data_sources}\n"
+    "\n"
+    "**Metrics:** {metrics}\n"
+    "\n"
+    "---\n"
+)
+
 
 class MedRxivHarvester:
     """Main harvester for medRxiv AI articles."""
@@ -38,7 +74,7 @@ class MedRxivHarvester:
         year: Optional[int] = None,
         max_articles: int = 200,
         llm_concurrency: int = 3,
-        llm_delay: float = 0.5
+        llm_delay: float = 0.0
     ):
         """
         Initialize harvester.
@@ -49,7 +85,9 @@ class MedRxivHarvester:
             year: Filter by publication year (e.g., 2025)
             max_articles: Maximum articles to fetch
             llm_concurrency: LLM request concurrency limit
-            llm_delay: Delay between LLM requests in seconds
+            llm_delay: Optional pause in seconds after each LLM request, per
+                concurrent slot (rate limits are otherwise handled by retrying
+                429 responses with exponential backoff)
         """
         self.keyword = keyword
         self.days = days
@@ -88,6 +126,15 @@ class MedRxivHarvester:
         """
         Run the full harvest process.
         
+        Returns:
+            Dictionary with results and statistics
+        """
+        return asyncio.run(self.harvest_async())
+    
+    async def harvest_async(self) -> Dict:
+        """
+        Run the full harvest process, extracting up to llm_concurrency articles at once.
+        
         Returns:
             Dictionary with results and statistics
         """
@@ -106,55 +153,11 @@ class MedRxivHarvester:
         
         # Step 3: Extract structured information
         logger.info("Extracting structured information from abstracts")
-        processed_articles = []
-        needs_review = []
-        
-        for i, article in enumerate(articles):
-            logger.info(f"Processing article {i+1}/{len(articles)}: {article.get('title', '')[:60]}...")
-            
-            # Check cache
-            article_id = article.get('id', '')
-            if article_id in self.cache:
-                logger.info(f"Using cached extraction for {article_id}")
-                processed_article = self.cache[article_id]
-            else:
-                # Extract with LLM
-                abstract = article.get('abstract', '')
-                
-                if not abstract or len(abstract.strip()) < 50:
-                    logger.warning(f"Abstract too short or missing for article {article_id}")
-                    extraction_result = {
-                        'what_done': '',
-                        'ai_role': '',
-                        'models': '',
-                        'data_sources': '',
-                        'metrics': ''
-                    }
-                    needs_manual_review = True
-                    raw_llm_output = None
-                else:
-                    extraction_result, needs_manual_review, raw_llm_output = self.extractor.extract(abstract)
-                
-                # Combine with metadata
-                processed_article = {
-                    **article,
-                    **extraction_result,
-                    'needs_manual_review': needs_manual_review,
-                    'raw_llm_output': raw_llm_output
-                }
-                
-                # Cache it
-                if article_id:
-                    self.cache[article_id] = processed_article
-                
-                # Rate limiting
-                if i < len(articles) - 1:  # Don't sleep after last article
-                    time.sleep(self.llm_delay)
-            
-            processed_articles.append(processed_article)
-            
-            if processed_article.get('needs_manual_review'):
-                needs_review.append(article_id)
+        processed_articles = await self._extract_articles(articles)
+        needs_review = [
+            article.get('id', '') for article in processed_articles
+            if article.get('needs_manual_review')
+        ]
         
         # Save cache
         self._save_cache()
@@ -177,6 +180,76 @@ class MedRxivHarvester:
             'needs_review': needs_review
         }
     
+    async def _extract_articles(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Extract structured information for all articles concurrently.
+        
+        At most llm_concurrency LLM requests are in flight at once; GLM
+        requests share one pooled aiohttp session.
+        
+        Returns:
+            Processed articles, in the same order as articles
+        """
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        
+        async def process(i: int, article: Dict, session) -> Dict:
+            logger.info(f"Processing article {i+1}/{len(articles)}: {article.get('title', '')[:60]}...")
+            
+            # Check cache
+            article_id = article.get('id', '')
+            if article_id in self.cache:
+                logger.info(f"Using cached extraction for {article_id}")
+                return self.cache[article_id]
+            
+            # Extract with LLM
+            abstract = article.get('abstract', '')
+            
+            if not abstract or len(abstract.strip()) < 50:
+                logger.warning(f"Abstract too short or missing for article {article_id}")
+                extraction_result = {
+                    'what_done': '',
+                    'ai_role': '',
+                    'models': '',
+                    'data_sources': '',
+                    'metrics': ''
+                }
+                needs_manual_review = True
+                raw_llm_output = None
+            else:
+                async with semaphore:
+                    extraction_result, needs_manual_review, raw_llm_output = (
+                        await self.extractor.extract_async(abstract, session)
+                    )
+                    if self.llm_delay:
+                        await asyncio.sleep(self.llm_delay)
+            
+            # Combine with metadata
+            processed_article = {
+                **article,
+                **extraction_result,
+                'needs_manual_review': needs_manual_review,
+                'raw_llm_output': raw_llm_output
+            }
+            
+            # Cache it
+            if article_id:
+                self.cache[article_id] = processed_article
+            
+            return processed_article
+        
+        session = None
+        if aiohttp is not None and self.extractor.glm_client is not None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.llm_concurrency)
+            )
+        try:
+            return list(await asyncio.gather(
+                *(process(i, article, session) for i, article in enumerate(articles))
+            ))
+        finally:
+            if session is not None:
+                await session.close()
+    
     def _enrich_articles(self, articles: List[Dict]) -> List[Dict]:
         """
         Enrich articles by fetching full abstracts if missing.
@@ -265,61 +338,26 @@ class MedRxivHarvester:
             ""
         ])
 
+        # One template fill per article; optional fields are pre-rendered or empty
+        blocks = ['\n'.join(lines)]
         for i, article in enumerate(articles, 1):
-            lines.extend([
-                f"#### {i}. {article.get('title', 'Untitled')}.",
-                "",
-                f"**Last Corresponding Author:** {article.get('last_corresponding_author', article.get('corresponding_author', 'N/A'))}",
-                ""
-            ])
-
-            # Last corresponding author affiliation
             last_corr_aff = article.get('last_corresponding_affiliation', '')
-            if last_corr_aff:
-                lines.extend([
-                    f"**Last Corresponding Author Affiliation:** {last_corr_aff}",
-                    ""
-                ])
-
-            # Published date
-            if article.get('published_at'):
-                lines.extend([
-                    f"**Published:** {article.get('published_at')}",
-                    ""
-                ])
-
-            # Link
-            if article.get('url'):
-                lines.extend([
-                    f"**URL:** {article.get('url')}",
-                    ""
-                ])
-
-            # Source
-            lines.extend([
-                f"**Source:** {article.get('source', 'unknown')}",
-                ""
-            ])
-
-            # Extracted information
-            lines.extend([
-                "##### Extracted Information",
-                "",
-                f"**What was done:** {article.get('what_done', 'N/A')}",
-                "",
-                f"**AI Role:** {article.get('ai_role', 'N/A')}",
-                "",
-                f"**Models:** {article.get('models', 'N/A')}",
-                "",
-                f"**Data Sources:** {article.get('data_sources', 'N/A')}",
-                "",
-                f"**Metrics:** {article.get('metrics', 'N/A')}",
-                "",
-                "---",
-                ""
-            ])
+            blocks.append(ARTICLE_MD_TEMPLATE.format(
+                i=i,
+                title=article.get('title', 'Untitled'),
+                author=article.get('last_corresponding_author', article.get('corresponding_author', 'N/A')),
+                affiliation=f"**Last Corresponding Author Affiliation:** {last_corr_aff}\n\n" if last_corr_aff else "",
+                published=f"**Published:** {article.get('published_at')}\n\n" if article.get('published_at') else "",
+                url=f"**URL:** {article.get('url')}\n\n" if article.get('url') else "",
+                source=article.get('source', 'unknown'),
+                what_done=article.get('what_done', 'N/A'),
+                ai_role=article.get('ai_role', 'N/A'),
+                models=article.get('models', 'N/A'),
+                data_sources=article.get('data_sources', 'N/A'),
+                metrics=article.get('metrics', 'N/A'),
+            ))
 
-        return '\n'.join(lines)
+        return '\n'.join(blocks)
     
     def _generate_statistics(
         self,
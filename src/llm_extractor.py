@@ -4,13 +4,18 @@ LLM Extractor with GLM -> OpenAI -> Heuristic fallback logic.
 import os
 import re
 import json
+import asyncio
 import logging
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 try:
-    from src.glm_client import GLMClient
+    from .glm_client import GLMClient, SYSTEM_PROMPT, USER_TEMPLATE
 except ImportError:
-    from glm_client import GLMClient
+    try:
+        from src.glm_client import GLMClient, SYSTEM_PROMPT, USER_TEMPLATE
+    except ImportError:
+        from glm_client import GLMClient, SYSTEM_PROMPT, USER_TEMPLATE
 
 # Optional OpenAI import
 try:
@@ -21,6 +26,42 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Patterns for parsing LLM responses and for heuristic extraction, compiled once at import
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+_WHAT_DONE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:we|this study|this work|the study)\s+([^.!?]+(?:investigated|analyzed|evaluated|examined|studied|assessed|compared|proposed|designed|implemented)[^.!?]+)',
+    r'(?:objective|aim|purpose|goal)[^.!?]*?:\s*([^.!?]+)',
+    r'(?:background|introduction)[^.!?]*?:\s*([^.!?]+)',
+))
+
+_AI_KEYWORDS = (
+    'artificial intelligence', 'machine learning', 'deep learning',
+    'neural network', 'ai', 'ml', 'algorithm', 'model', 'prediction',
+    'classification', 'detection', 'diagnosis', 'automated'
+)
+
+_MODEL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(?:CNN|RNN|LSTM|GRU|BERT|GPT|ResNet|VGG|AlexNet|Inception|MobileNet|EfficientNet)\b',
+    r'\b(?:random forest|decision tree|support vector machine|SVM|logistic regression|linear regression)\b',
+    r'\b(?:gradient boosting|XGBoost|LightGBM|CatBoost)\b',
+    r'\b(?:k-means|clustering|PCA)\b',
+))
+
+_DATA_SOURCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:dataset|data set|database|cohort|registry)[^.!?]*?(?:of|from|with)\s+([^.!?]{10,80})',
+    r'(?:using|from)\s+(?:the\s+)?([A-Z][A-Za-z\s]+(?:dataset|database|registry|cohort))',
+))
+
+# (reported name, lowercase form matched against the lowercased abstract)
+_METRIC_KEYWORDS = tuple((keyword, keyword.lower()) for keyword in (
+    'accuracy', 'precision', 'recall', 'F1', 'AUC', 'ROC',
+    'sensitivity', 'specificity', 'AUROC', 'RMSE', 'MAE',
+    'R-squared', 'confusion matrix', 'performance'
+))
+
 
 class LLMExtractor:
     """Extracts structured information from abstracts using LLM with fallback."""
@@ -74,6 +115,42 @@ class LLMExtractor:
                 logger.warning(f"❌ GLM extraction failed: {e}, falling back to OpenAI")
                 logger.debug(f"GLM error details: {str(e)}", exc_info=True)
 
+        return self._extract_fallback(abstract)
+
+    async def extract_async(
+        self, abstract: str, session=None
+    ) -> Tuple[Dict[str, str], bool, Optional[str]]:
+        """
+        Async counterpart of extract(), so many abstracts can be in flight at once.
+
+        Args:
+            abstract: The abstract text to analyze
+            session: Optional shared aiohttp.ClientSession for GLM requests;
+                without one the blocking GLM request runs in a worker thread
+
+        Returns:
+            Same tuple as extract()
+        """
+        logger.info(f"Starting extraction for abstract of length: {len(abstract)}")
+
+        # Try GLM first
+        if self.glm_client:
+            try:
+                logger.info("Attempting GLM extraction...")
+                result = await self.glm_client.extract_structured_info_async(abstract, session)
+                logger.info("✅ Successfully extracted using GLM")
+                return result, False, None
+            except Exception as e:
+                logger.warning(f"❌ GLM extraction failed: {e}, falling back to OpenAI")
+                logger.debug(f"GLM error details: {str(e)}", exc_info=True)
+
+        # The OpenAI request is blocking; keep it off the event loop
+        if self.openai_client:
+            return await asyncio.to_thread(self._extract_fallback, abstract)
+        return self._extract_fallback(abstract)
+
+    def _extract_fallback(self, abstract: str) -> Tuple[Dict[str, str], bool, Optional[str]]:
+        """Extract with OpenAI, or heuristically if that is unavailable or fails."""
         # Try OpenAI as fallback
         if self.openai_client:
             try:
@@ -92,6 +169,25 @@ class LLMExtractor:
         result = self._heuristic_extract(abstract)
         logger.info(f"Heuristic result: {result}")
         return result, True, None
+
+    def extract_batch(
+        self, abstracts: List[str], max_workers: int = 8
+    ) -> List[Tuple[Dict[str, str], bool, Optional[str]]]:
+        """
+        Extract several abstracts, overlapping their API round-trips.
+
+        Args:
+            abstracts: The abstract texts to analyze
+            max_workers: Maximum number of API requests in flight at once
+
+        Returns:
+            List of extract() results, in the same order as abstracts
+        """
+        # Heuristic-only extraction is pure Python work; threads would not overlap it
+        if len(abstracts) <= 1 or not (self.glm_client or self.openai_client):
+            return [self.extract(abstract) for abstract in abstracts]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(abstracts))) as pool:
+            return list(pool.map(self.extract, abstracts))
     
     def _extract_with_openai(self, abstract: str) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
         """
@@ -103,27 +199,13 @@ class LLMExtractor:
         Returns:
             Tuple of (extracted_data or None, raw_output)
         """
-        system_prompt = (
-            "你是一个科学文献分析助手。请从摘要中提取以下信息，并输出严格的一个JSON对象，包含以下键：\n"
-            "- what_done: 这篇论文做了什么（详细描述研究内容、研究方法、研究目标、实验设计、主要发现等，要求详细且完整，尽量包含研究的关键步骤和主要结果，字数控制在300-500字）\n"
-            "- ai_role: 用AI做了什么（AI在研究中扮演的角色、具体应用场景、如何使用AI解决问题等，要求详细说明AI的具体作用和应用方式，字数控制在200-300字）\n"
-            "- models: 用了哪个模型（模型名称、算法类型、架构等，用英文原名称）\n"
-            "- data_sources: 数据资源（数据集来源、数据规模、数据类型等，详细描述）\n"
-            "- metrics: 评估指标（可选，如果有的话）\n"
-            "重要要求：\n"
-            "1. what_done 和 ai_role 必须用中文回答，内容要详细和完整\n"
-            "2. models 和 data_sources 可以用英文（如果是专有名词），也可以中英结合\n"
-            "3. 所有内容要准确反映摘要中的信息，不要编造\n"
-            "4. 如果某个字段找不到，设置为空字符串"
-        )
-        
-        user_prompt = f'摘要：\n"""\n{abstract}\n"""\n\n请从上述摘要中提取信息，用中文详细描述研究内容和AI应用。只返回JSON对象，不要其他文字。'
+        user_prompt = USER_TEMPLATE.format(abstract=abstract)
         
         try:
             response = self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.0,
@@ -154,7 +236,7 @@ class LLMExtractor:
             pass
         
         # Try to find JSON block
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(content)
         if json_match:
             try:
                 return json.loads(json_match.group(1))
@@ -162,7 +244,7 @@ class LLMExtractor:
                 pass
         
         # Try to find any JSON object
-        json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', content, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(content)
         if json_match:
             try:
                 return json.loads(json_match.group(0))
@@ -227,19 +309,13 @@ class LLMExtractor:
     def _extract_what_done(self, abstract: str) -> str:
         """Extract what was done from abstract."""
         # Look for sentences with key phrases
-        patterns = [
-            r'(?:we|this study|this work|the study)\s+([^.!?]+(?:investigated|analyzed|evaluated|examined|studied|assessed|compared|proposed|designed|implemented)[^.!?]+)',
-            r'(?:objective|aim|purpose|goal)[^.!?]*?:\s*([^.!?]+)',
-            r'(?:background|introduction)[^.!?]*?:\s*([^.!?]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, abstract, re.IGNORECASE)
+        for pattern in _WHAT_DONE_PATTERNS:
+            match = pattern.search(abstract)
             if match:
                 return match.group(1).strip()
         
         # Fallback: return first sentence
-        sentences = re.split(r'[.!?]+', abstract)
+        sentences = _SENTENCE_SPLIT_RE.split(abstract)
         if sentences:
             return sentences[0].strip()
         
@@ -247,33 +323,19 @@ class LLMExtractor:
     
     def _extract_ai_role(self, abstract: str) -> str:
         """Extract AI role from abstract."""
-        ai_keywords = [
-            'artificial intelligence', 'machine learning', 'deep learning',
-            'neural network', 'ai', 'ml', 'algorithm', 'model', 'prediction',
-            'classification', 'detection', 'diagnosis', 'automated'
-        ]
-        
-        sentences = re.split(r'[.!?]+', abstract)
+        sentences = _SENTENCE_SPLIT_RE.split(abstract)
         for sentence in sentences:
             sentence_lower = sentence.lower()
-            if any(keyword in sentence_lower for keyword in ai_keywords):
+            if any(keyword in sentence_lower for keyword in _AI_KEYWORDS):
                 return sentence.strip()
         
         return ""
     
     def _extract_models(self, abstract: str) -> str:
         """Extract model names from abstract."""
-        model_patterns = [
-            r'\b(?:CNN|RNN|LSTM|GRU|BERT|GPT|ResNet|VGG|AlexNet|Inception|MobileNet|EfficientNet)\b',
-            r'\b(?:random forest|decision tree|support vector machine|SVM|logistic regression|linear regression)\b',
-            r'\b(?:gradient boosting|XGBoost|LightGBM|CatBoost)\b',
-            r'\b(?:k-means|clustering|PCA)\b',
-        ]
-        
         models = []
-        for pattern in model_patterns:
-            matches = re.findall(pattern, abstract, re.IGNORECASE)
-            models.extend(matches)
+        for pattern in _MODEL_PATTERNS:
+            models.extend(pattern.findall(abstract))
         
         if models:
             return ', '.join(set(models))
@@ -282,13 +344,8 @@ class LLMExtractor:
     def _extract_data_sources(self, abstract: str) -> str:
         """Extract data sources from abstract."""
         # Look for dataset mentions
-        patterns = [
-            r'(?:dataset|data set|database|cohort|registry)[^.!?]*?(?:of|from|with)\s+([^.!?]{10,80})',
-            r'(?:using|from)\s+(?:the\s+)?([A-Z][A-Za-z\s]+(?:dataset|database|registry|cohort))',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, abstract, re.IGNORECASE)
+        for pattern in _DATA_SOURCE_PATTERNS:
+            match = pattern.search(abstract)
             if match:
                 return match.group(1).strip()
         
@@ -296,16 +353,10 @@ class LLMExtractor:
     
     def _extract_metrics(self, abstract: str) -> str:
         """Extract evaluation metrics from abstract."""
-        metric_keywords = [
-            'accuracy', 'precision', 'recall', 'F1', 'AUC', 'ROC',
-            'sensitivity', 'specificity', 'AUROC', 'RMSE', 'MAE',
-            'R-squared', 'confusion matrix', 'performance'
-        ]
-        
         metrics = []
         abstract_lower = abstract.lower()
-        for keyword in metric_keywords:
-            if keyword.lower() in abstract_lower:
+        for keyword, keyword_lower in _METRIC_KEYWORDS:
+            if keyword_lower in abstract_lower:
                 metrics.append(keyword)
         
         if metrics:
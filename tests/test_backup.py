@@ -0,0 +1,31 @@
+"""
+Tests for the content-addressed backups shared by the cleanup tools.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from _backup import make_backup, write_atomic
+
+
+def test_unlinked_copies_are_pruned():
+    """A stored copy is deleted when the last backup name moves off it, and kept while one remains."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report = Path(tmp_dir) / 'report.md'
+        store = Path(tmp_dir) / 'backups'
+        report.write_bytes(b'v1')
+        make_backup(report, '.bak')
+        make_backup(report, '.bak2')
+        assert len(list(store.iterdir())) == 1
+
+        write_atomic(report, b'v2')
+        make_backup(report, '.bak')
+        assert len(list(store.iterdir())) == 2  # .bak2 still holds v1
+
+        make_backup(report, '.bak2')
+        assert len(list(store.iterdir())) == 1
+        assert (Path(tmp_dir) / 'report.md.bak').read_bytes() == b'v2'
+        assert (Path(tmp_dir) / 'report.md.bak2').read_bytes() == b'v2'
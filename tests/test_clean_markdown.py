@@ -0,0 +1,61 @@
+"""
+Tests for the one-pass markdown cleanup in tools/clean_markdown.py.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import clean_markdown
+import insert_sources_summary
+
+SAMPLE = """# AI Articles Report
+
+**Generated:** 2025-11-01T10:41:43Z
+---
+
+## 1. First article
+
+**All Affiliations:** Department of Radiology, Example University
+
+**Source:** pubmed
+
+**AI Role:** A CNN classifies chest X-rays.
+
+---
+
+## 2. Second article
+
+**Source:** arxiv
+
+**AI Role:** A transformer predicts readmission.
+"""
+
+
+def test_second_run_is_unchanged(capsys):
+    """Cleaning an already cleaned report changes nothing and stores no new backup."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report = Path(tmp_dir) / 'report.md'
+        report.write_text(SAMPLE, encoding='utf-8')
+
+        assert clean_markdown.main([str(report)]) == 0
+        cleaned = report.read_bytes()
+        blobs = sorted((Path(tmp_dir) / 'backups').iterdir())
+        assert b'**All Affiliations:**' not in cleaned
+        assert cleaned.count(b'## Sources summary') == 1
+        assert 'Cleaned:' in capsys.readouterr().out
+
+        assert clean_markdown.main([str(report)]) == 0
+        assert 'Unchanged:' in capsys.readouterr().out
+        assert report.read_bytes() == cleaned
+        assert sorted((Path(tmp_dir) / 'backups').iterdir()) == blobs
+
+
+def test_summary_update_replaces_whole_block():
+    """Updating the Sources summary keeps one divider and does not count its own heading."""
+    once = insert_sources_summary.clean_text(SAMPLE)
+    assert insert_sources_summary.clean_text(once) == once
+    assert '**Total Articles (detected):** 2\n' in once
+    assert once.count('---\n') == SAMPLE.count('---\n') + 1
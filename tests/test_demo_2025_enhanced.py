@@ -0,0 +1,132 @@
+"""
+Tests for the 2025 demo's batched GLM extraction and its cache.
+"""
+import sys
+import io
+import json
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add tools and src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import demo_2025_enhanced as demo
+from glm_client import GLMClient
+
+FALLBACK_ROW = {
+    'what_done': 'heuristic', 'ai_role': '', 'models': '', 'data_sources': '', 'metrics': ''
+}
+
+
+class StubGLM:
+    """Stands in for AsyncGLM: a canned batched response and a stubbed fallback chain."""
+
+    def __init__(self, content=None, needs_review=True):
+        self.client = GLMClient(api_key='test')
+        self.content = content  # None answers every batched request with an error
+        self.needs_review = needs_review
+        self.singles = 0
+
+    async def chat(self, messages, max_tokens):
+        if self.content is None:
+            raise Exception("401 Client Error: Unauthorized")
+        return {'choices': [{'message': {'content': self.content}}]}
+
+    async def extract_one(self, abstract):
+        self.singles += 1
+        return FALLBACK_ROW, self.needs_review
+
+
+def _rows(n):
+    return json.dumps([
+        {'what_done': f'row {i}', 'ai_role': 'r', 'models': 'm', 'data_sources': 'd', 'metrics': 'x'}
+        for i in range(n)
+    ])
+
+
+def _extract(articles, glm, cache_dir):
+    cache = demo.ExtractionCache(cache_dir)
+    return asyncio.run(demo.extract_batch(articles, cache, glm)), cache
+
+
+def test_failed_batch_is_flagged_and_not_cached():
+    """A failed batched request falls back per abstract; fallback rows are flagged and never cached."""
+    articles = demo._load_data()['articles'][:3]
+    glm = StubGLM()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir) / 'glm_cache'
+        results, cache = _extract(articles, glm, cache_dir)
+
+        assert glm.singles == len(articles)
+        assert results == [(FALLBACK_ROW, True)] * len(articles)
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
+        assert all(demo.ExtractionCache(cache_dir).get(a) is None for a in articles)
+        assert all(cache.get(a) is None for a in articles)
+
+
+def test_short_batch_falls_back_without_caching():
+    """A response with the wrong row count is re-extracted one by one; even clean fallback rows stay uncached."""
+    articles = demo._load_data()['articles'][:3]
+    glm = StubGLM(_rows(len(articles) - 1), needs_review=False)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir) / 'glm_cache'
+        results, _ = _extract(articles, glm, cache_dir)
+
+        assert glm.singles == len(articles)
+        assert results == [(FALLBACK_ROW, False)] * len(articles)
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+
+def test_good_batch_is_cached_on_disk():
+    """Rows from a usable batched response are cached and served from disk by the next run."""
+    articles = demo._load_data()['articles'][:3]
+    glm = StubGLM(_rows(len(articles)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir) / 'glm_cache'
+        results, _ = _extract(articles, glm, cache_dir)
+
+        assert glm.singles == 0
+        assert [needs_review for _, needs_review in results] == [False] * len(articles)
+        assert [extraction['what_done'] for extraction, _ in results] == ['row 0', 'row 1', 'row 2']
+        assert len(list(cache_dir.glob('*.json'))) == len(articles)
+
+        next_run = demo.ExtractionCache(cache_dir)
+        assert [next_run.get(a) for a in articles] == [extraction for extraction, _ in results]
+        assert next_run.disk_hits == len(articles)
+
+
+def test_process_articles_records_review_flag():
+    """needs_manual_review in the results follows the extraction, in input order."""
+    articles = demo._load_data()['articles']
+    glm = StubGLM()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        buf = io.BytesIO()
+        json_out = demo.JSONArrayWriter(buf)
+        cache = demo.ExtractionCache(Path(tmp_dir) / 'glm_cache')
+        total, flagged = asyncio.run(demo.process_articles(articles, cache, json_out, glm=glm, quiet=True))
+        json_out.close()
+
+    rows = json.loads(buf.getvalue())
+    assert total == flagged == len(articles)
+    assert [row['doi'] for row in rows] == [a.doi for a in articles]
+    assert all(row['needs_manual_review'] is True for row in rows)
+
+
+def test_simulated_run_needs_no_review():
+    """Without GLM the simulated extractions are used and none is flagged."""
+    articles = demo._load_data()['articles']
+    buf = io.BytesIO()
+    json_out = demo.JSONArrayWriter(buf)
+    total, flagged = asyncio.run(
+        demo.process_articles(articles, demo.ExtractionCache(), json_out, quiet=True)
+    )
+    json_out.close()
+
+    assert (total, flagged) == (len(articles), 0)
+    assert [row['needs_manual_review'] for row in json.loads(buf.getvalue())] == [False] * len(articles)
@@ -2,6 +2,7 @@
 Integration tests for the LLM extractor.
 """
 import sys
+import asyncio
 from pathlib import Path
 
 # Add src to path
@@ -140,6 +141,55 @@ def test_heuristic_extractor():
         return 1
 
 
+def test_extract_batch():
+    """Test that batch extraction matches per-abstract extraction, in order."""
+    
+    print("\nTesting batch extraction")
+    print("=" * 80)
+    
+    extractor = LLMExtractor()
+    
+    abstracts = [
+        "We trained a random forest on 2,000 EHR records; AUC was 0.81.",
+        "A convolutional neural network (CNN) classified chest X-rays with 93% accuracy.",
+        "This cohort study measured blood pressure in 500 adults."
+    ]
+    
+    results = extractor.extract_batch(abstracts)
+    
+    assert len(results) == len(abstracts)
+    if not (extractor.glm_client or extractor.openai_client):
+        # Heuristic mode is deterministic, so results must match one-by-one extraction
+        assert results == [extractor.extract(abstract) for abstract in abstracts]
+    assert extractor.extract_batch([]) == []
+    
+    print(f"✓ Batch extraction returned {len(results)} results in order")
+
+
+def test_extract_async():
+    """Test that async extraction returns the same result shape as extract()."""
+    
+    print("\nTesting async extraction")
+    print("=" * 80)
+    
+    extractor = LLMExtractor()
+    
+    abstract = """
+    We trained a gradient boosting (XGBoost) model on 3,000 patient records
+    to predict ICU admission. The model achieved an AUROC of 0.88.
+    """
+    
+    result, needs_review, raw_output = asyncio.run(extractor.extract_async(abstract))
+    
+    for field in ['what_done', 'ai_role', 'models', 'data_sources', 'metrics']:
+        assert isinstance(result[field], str), f"Field {field} is not a string"
+    if not (extractor.glm_client or extractor.openai_client):
+        # Heuristic mode is deterministic, so the result must match extract()
+        assert (result, needs_review, raw_output) == extractor.extract(abstract)
+    
+    print("✓ Async extraction completed")
+
+
 def main():
     """Run all tests."""
     print("Running integration tests for medRxiv harvester")
@@ -157,6 +207,20 @@ def main():
     if result2 != 0:
         exit_code = 1
     
+    # Test 3: Batch extraction (raises on failure so pytest reports it)
+    try:
+        test_extract_batch()
+    except Exception as e:
+        print(f"✗ Batch extraction test failed: {e}")
+        exit_code = 1
+    
+    # Test 4: Async extraction (raises on failure so pytest reports it)
+    try:
+        test_extract_async()
+    except Exception as e:
+        print(f"✗ Async extraction test failed: {e}")
+        exit_code = 1
+    
     print("\n" + "=" * 80)
     if exit_code == 0:
         print("✓ All integration tests passed!")
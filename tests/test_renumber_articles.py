@@ -0,0 +1,43 @@
+"""
+Tests for renumbering report headings in tools/renumber_articles.py.
+"""
+import sys
+import errno
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import renumber_articles
+from _backup import write_atomic
+
+
+def test_renumber_backup_survives_failed_replace():
+    """A failed renumber rewrite leaves the report intact and no backup sharing it."""
+    original = "## 3. First\n\n## 7. Second\n"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report = Path(tmp_dir) / "report.md"
+        report.write_text(original, encoding="utf-8")
+        backup = report.with_name(report.name + ".renumber.bak")
+
+        # Disk full while swapping in the rewrite
+        with mock.patch("os.replace", side_effect=OSError(errno.ENOSPC, "No space left on device")):
+            with pytest.raises(OSError):
+                renumber_articles.renumber_file(report, ".renumber.bak")
+
+        assert report.read_text(encoding="utf-8") == original
+        assert report.stat().st_nlink == 1, "report is hardlinked into the backup store"
+        assert not backup.exists()
+        assert sorted(p.name for p in Path(tmp_dir).iterdir()) in (["report.md"], ["backups", "report.md"])
+
+        # After a successful run, later rewrites of the report leave the backup alone
+        assert renumber_articles.renumber_file(report, ".renumber.bak") == 2
+        assert report.read_text(encoding="utf-8") == "## 1. First\n\n## 2. Second\n"
+        assert backup.read_text(encoding="utf-8") == original
+        write_atomic(report, b"## 1. Edited\n")
+        assert backup.read_text(encoding="utf-8") == original
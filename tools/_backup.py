@@ -0,0 +1,149 @@
+"""
+Content-addressed backups and atomic writes shared by the cleanup tools.
+
+Each file content is stored once as `backups/<hash><suffix>` next to the file;
+the per-tool backup names (`.bak`, `.bak2`, ...) are hardlinks to that copy, so
+running the tools one after another does not rewrite the same report again.
+A stored copy is deleted once no backup name links to it any more, so the
+store holds only the contents the current backups point at.
+Files are only ever replaced whole (os.replace), never rewritten in place, so a
+stored copy can never change under its hash.
+"""
+from pathlib import Path
+from typing import Optional
+import hashlib
+import os
+import shutil
+import tempfile
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def content_hash(data: bytes) -> str:
+    """Short hex digest of data (xxh3 when available, blake2b otherwise)."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def write_atomic(target: Path, data: bytes):
+    """Replace target with data via a temporary file in the same directory."""
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if target.exists():
+            shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _blob_path(path: Path, data) -> Path:
+    store = path.parent / "backups"
+    store.mkdir(exist_ok=True)
+    return store / f"{content_hash(data)}{path.suffix}"
+
+
+def _store_copy(blob: Path, data, stat_source: Path):
+    """Write data to blob (a copy, never a link to a live file)."""
+    fd, tmp = tempfile.mkstemp(dir=blob.parent, prefix=blob.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        shutil.copystat(stat_source, tmp)
+        os.replace(tmp, blob)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _link_backup(path: Path, blob: Path, suffix: str) -> Path:
+    """Point `<path><suffix>` at blob and return it, dropping the previous copy if now unused."""
+    backup = path.with_name(path.name + suffix)
+    old_blob = None
+    if backup.exists():
+        if os.path.samefile(blob, backup):
+            # already linked; renaming a link over the same inode would be a no-op anyway
+            return backup
+        stored = _blob_path(path, backup.read_bytes())
+        if stored.exists() and os.path.samefile(stored, backup):
+            old_blob = stored
+    # link under a temporary name first so an existing backup is swapped atomically
+    tmp = backup.with_name(backup.name + ".tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(blob, tmp)
+    except OSError:
+        # no hardlinks on this filesystem: fall back to a plain copy
+        shutil.copy2(blob, tmp)
+    os.replace(tmp, backup)
+    if old_blob is not None and old_blob.stat().st_nlink == 1:
+        # the backup just moved off it was its last link
+        old_blob.unlink(missing_ok=True)
+    return backup
+
+
+def make_backup(path: Path, suffix: str = ".bak", data: Optional[bytes] = None) -> Path:
+    """
+    Back up path as `<path><suffix>`, linked to a single stored copy per content.
+
+    Args:
+        path: File to back up
+        suffix: Suffix appended to the file name for the backup link
+        data: Contents of path if the caller has already read them
+
+    Returns:
+        Path of the backup
+    """
+    if data is None:
+        data = path.read_bytes()
+    blob = _blob_path(path, data)
+    if not blob.exists():
+        _store_copy(blob, data, path)
+    return _link_backup(path, blob, suffix)
+
+
+def replace_with_backup(tmp, path: Path, suffix: str, data) -> Path:
+    """
+    Move the finished file tmp over path, keeping the old contents as `<path><suffix>`.
+
+    The old inode is kept as the stored copy, so no data is copied. It only
+    enters the store, and the backup name is only created, once os.replace()
+    has succeeded; if the replace fails, the store and the backups are untouched.
+
+    Args:
+        tmp: Fully written replacement file in the same directory as path
+        path: File being replaced
+        suffix: Suffix appended to the file name for the backup link
+        data: Current contents of path (bytes or mmap), used for the hash
+
+    Returns:
+        Path of the backup
+    """
+    blob = _blob_path(path, data)
+    hold = None
+    if not blob.exists():
+        hold = blob.with_name(f"{blob.name}.{os.getpid()}.hold")
+        try:
+            hold.unlink(missing_ok=True)
+            os.link(path, hold)
+        except OSError:
+            # no hardlinks on this filesystem: store a copy while path still holds the data
+            hold = None
+            _store_copy(blob, data, path)
+
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        if hold is not None:
+            hold.unlink(missing_ok=True)
+        raise
+
+    if hold is not None:
+        os.replace(hold, blob)
+    return _link_backup(path, blob, suffix)
@@ -0,0 +1,39 @@
+"""
+Indented JSON output shared by the demo scripts.
+
+Both demos write their results as one pretty-printed JSON array, the layout
+json.dump(items, f, indent=2) gives, but stream it one element at a time so
+the full result list is never held in memory.
+"""
+import json
+
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_indented(obj) -> bytes:
+    """Serialize obj as UTF-8 JSON with 2-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class JSONArrayWriter:
+    """Write a pretty-printed JSON array to a binary file one element at a time."""
+
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+
+    def write(self, item):
+        self.f.write(b'[\n  ' if self.count == 0 else b',\n  ')
+        # Same layout as json.dump(items, f, indent=2): elements nested one level.
+        # Strings never contain raw newlines in JSON, so splitting on them is safe.
+        self.f.write(dumps_indented(item).replace(b'\n', b'\n  '))
+        self.count += 1
+
+    def close(self):
+        self.f.write(b'\n]' if self.count else b'[]')
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Run every markdown cleanup step over one or more report files.
+
+Each file is read once, passed through the cleanup transforms below in order,
+then backed up and written once (only if something changed). With several
+files the work is spread over a process pool.
+
+Usage: python tools/clean_markdown.py [FILE ...]
+(defaults to the report the individual cleanup scripts target)
+"""
+from pathlib import Path
+from multiprocessing import Pool
+import argparse
+import os
+
+import insert_sources_summary
+import remove_abstract_excerpt
+import remove_abstract_paragraphs_after_metrics
+import remove_all_affiliations
+import remove_articles_with_empty_ai_role
+from _backup import make_backup, write_atomic
+
+# Pure str -> str steps, in the order the individual scripts are meant to run
+TRANSFORMS = [
+    remove_abstract_excerpt.clean_text,
+    remove_abstract_paragraphs_after_metrics.clean_text,
+    remove_all_affiliations.clean_text,
+    remove_articles_with_empty_ai_role.clean_text,
+    insert_sources_summary.clean_text,
+]
+
+
+def clean_text(text: str) -> str:
+    for transform in TRANSFORMS:
+        text = transform(text)
+    return text
+
+
+def clean_file(path: Path) -> bool:
+    """
+    Clean path in place.
+
+    Returns:
+        True if the file changed (a `.clean.bak` backup is made first)
+    """
+    data = path.read_bytes()
+    new_data = clean_text(data.decode("utf-8")).encode("utf-8")
+    if new_data == data:
+        return False
+    make_backup(path, ".clean.bak", data)
+    write_atomic(path, new_data)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*", type=Path, help="Markdown reports to clean")
+    args = parser.parse_args(argv)
+
+    paths = args.files
+    if not paths:
+        repo_root = Path(__file__).resolve().parents[1]
+        paths = [repo_root / "data" / "medrxiv-ai-20251101-102613.md"]
+    missing = [p for p in paths if not p.exists()]
+    if missing:
+        for p in missing:
+            print(f"Target not found: {p}")
+        return 2
+
+    if len(paths) == 1:
+        changed = [clean_file(paths[0])]
+    else:
+        # files are independent, so they scale across processes
+        with Pool(min(len(paths), os.cpu_count() or 1)) as pool:
+            changed = pool.map(clean_file, paths)
+
+    for path, did_change in zip(paths, changed):
+        print(f"{'Cleaned' if did_change else 'Unchanged'}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
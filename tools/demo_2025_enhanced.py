@@ -3,408 +3,762 @@
 Enhanced demo with 2025 articles and improved extraction detail.
 This demonstrates the quality of extraction with GLM API.
 """
+import argparse
+import os
+import re
 import sys
+import asyncio
+import contextlib
 import json
+import hashlib
+import functools
+import tempfile
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+from dataclasses import dataclass
+from typing import Mapping, Optional, Tuple
 
-# Add src to path
-src_path = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_path))
-
-from llm_extractor import LLMExtractor
-
-# Sample 2025 medRxiv abstracts with realistic AI research
-SAMPLE_ABSTRACTS_2025 = [
-    {
-        "title": "Multimodal Large Language Models for Automated Radiology Report Generation and Clinical Decision Support",
-        "authors": ["Chen X", "Wang H", "Liu Y", "Zhang M"],
-        "corresponding_author": "Chen X",
-        "affiliations": ["Johns Hopkins University", "Stanford AI Lab"],
-        "abstract": """
-Background: Radiology report generation remains time-intensive, and diagnostic accuracy varies across expertise levels.
-We developed a multimodal large language model (MLLM) integrating visual and textual information for automated 
-radiology report generation with clinical decision support.
-
-Methods: We trained GPT-4V-based architecture on 450,000 paired chest X-rays and reports from 120 hospitals across 
-three continents (2020-2024). The model processes DICOM images and patient history to generate structured reports 
-following the ACR standardized template. We incorporated retrieval-augmented generation (RAG) to reference similar 
-historical cases and current clinical guidelines. The system was evaluated against 50 board-certified radiologists 
-on 5,000 test cases using BLEU-4, clinical accuracy metrics, and time-to-diagnosis measurements.
-
-Results: The MLLM achieved 0.89 BLEU-4 score for report quality, with 94.2% accuracy for critical findings detection 
-(95% CI: 93.1-95.3), compared to 92.8% for junior radiologists and 96.1% for senior radiologists. Sensitivity for 
-pneumothorax was 96.7%, specificity 98.2%. The model reduced average report generation time from 8.3 minutes to 
-45 seconds while maintaining comparable accuracy. In a prospective clinical trial across 15 emergency departments, 
-AI-assisted reporting reduced door-to-diagnosis time by 42% and improved inter-reader agreement (kappa 0.91 vs 0.78).
-
-Conclusions: Multimodal LLMs can generate high-quality radiology reports approaching senior radiologist performance, 
-with potential to improve clinical workflow efficiency and diagnostic consistency in resource-limited settings.
-        """,
-        "url": "https://www.medrxiv.org/content/10.1101/2025.01.08.25301234",
-        "published_at": "2025-01-08T00:00:00",
-        "source": "medrxiv_2025",
-        "doi": "10.1101/2025.01.08.25301234"
-    },
-    {
-        "title": "Foundation Models for Protein Structure Prediction: AlphaFold 3 Validation in Drug Discovery Pipeline",
-        "authors": ["Kumar R", "Thompson S", "Patel N", "Anderson K"],
-        "corresponding_author": "Kumar R",
-        "affiliations": ["MIT CSAIL", "Broad Institute", "Pfizer Research"],
-        "abstract": """
-Objective: To validate AlphaFold 3's protein structure predictions in a real-world drug discovery pipeline and 
-assess its impact on hit-to-lead optimization timelines.
-
-Methods: We integrated AlphaFold 3 into our structure-based drug design workflow for three therapeutic targets: 
-KRAS G12C (oncology), PCSK9 (cardiovascular), and SARS-CoV-2 main protease. The foundation model predicted 
-protein-ligand complexes for 2,847 compounds, which were validated through X-ray crystallography (n=124) and 
-cryo-EM (n=38). We compared prediction accuracy, computational cost, and drug optimization outcomes against 
-traditional homology modeling and molecular dynamics approaches. A retrospective analysis examined 18 completed 
-drug discovery programs from 2020-2024.
-
-Results: AlphaFold 3 achieved 1.8Å median RMSD for backbone prediction and 2.4Å for ligand binding poses, 
-representing 34% improvement over previous methods. Prediction confidence scores (pLDDT >90) showed 97% correlation 
-with experimental validation. In prospective drug optimization, AI-guided designs showed 2.3× higher success rate 
-in lead optimization (45% vs 19%, p<0.001) and reduced average optimization cycles from 4.2 to 2.7. The foundation 
-model reduced computational time from 72 hours (MD simulations) to 15 minutes while using 95% less computational 
-resources. Integration into the pipeline accelerated preclinical candidate identification by 8-14 months.
-
-Conclusions: Foundation models for protein structure enable accurate, rapid predictions that significantly 
-accelerate drug discovery timelines and reduce computational costs, with performance approaching experimental methods.
-        """,
-        "url": "https://www.medrxiv.org/content/10.1101/2025.02.14.25302567",
-        "published_at": "2025-02-14T00:00:00",
-        "source": "medrxiv_2025",
-        "doi": "10.1101/2025.02.14.25302567"
-    },
-    {
-        "title": "Real-World Implementation of AI-Powered Sepsis Prediction in ICUs: Multi-Center Randomized Controlled Trial",
-        "authors": ["Martinez A", "Johnson M", "Williams R", "Brown L", "Davis K"],
-        "corresponding_author": "Martinez A",
-        "affiliations": ["Mayo Clinic", "Cleveland Clinic", "Massachusetts General Hospital"],
-        "abstract": """
-Background: Sepsis remains a leading cause of hospital mortality with time-critical treatment windows. We conducted 
-a multi-center RCT evaluating an AI-powered early warning system for sepsis prediction in intensive care units.
-
-Methods: This pragmatic RCT enrolled 12,450 ICU patients across 24 hospitals (June 2024-January 2025). The intervention 
-arm received real-time sepsis predictions from a transformer-based deep learning model analyzing 147 clinical variables 
-from EHR streams (vital signs, labs, medications, nursing notes). The model was trained on 380,000 ICU admissions using 
-temporal convolutional networks with attention mechanisms, predicting sepsis onset 6-12 hours before clinical criteria. 
-Control arm received standard care. Primary outcome was 28-day mortality; secondary outcomes included time-to-antibiotic 
-administration, ICU length of stay, and cost-effectiveness.
-
-Results: The AI system achieved AUROC 0.94 (95% CI: 0.93-0.95) for 6-hour ahead prediction with 87% sensitivity at 
-90% specificity. In the intervention arm, 28-day mortality was reduced from 14.2% to 11.3% (absolute risk reduction 
-2.9%, p=0.002, NNT=34). Median time from sepsis onset to antibiotic administration decreased from 3.2 to 1.8 hours 
-(p<0.001). Early detection enabled 24% reduction in median ICU length of stay (5.2 vs 6.8 days) and $8,400 lower 
-per-patient costs. The system showed consistent performance across diverse patient populations and hospital settings 
-with minimal performance degradation (AUROC variation 0.91-0.96). Alert fatigue was manageable with 12% false positive 
-rate and positive predictive value of 31%.
-
-Conclusions: AI-powered sepsis prediction integrated into clinical workflows significantly reduces mortality and 
-healthcare costs, demonstrating the potential of machine learning for real-time clinical decision support in 
-critical care settings.
-        """,
-        "url": "https://www.medrxiv.org/content/10.1101/2025.03.22.25303891",
-        "published_at": "2025-03-22T00:00:00",
-        "source": "medrxiv_2025",
-        "doi": "10.1101/2025.03.22.25303891"
-    },
-    {
-        "title": "Federated Learning for Privacy-Preserving Genomic Analysis: A Multi-Institutional Pediatric Cancer Study",
-        "authors": ["Lee J", "Park S", "Kim H", "Choi Y", "Song M"],
-        "corresponding_author": "Lee J",
-        "affiliations": ["Seoul National University Hospital", "Stanford Medicine", "Children's Hospital of Philadelphia"],
-        "abstract": """
-Purpose: Pediatric cancer genomics requires large-scale multi-institutional collaboration, but data sharing is 
-constrained by privacy regulations and institutional policies. We implemented federated learning to enable 
-collaborative genomic analysis without sharing raw patient data.
-
-Methods: We established a federated learning network across 42 pediatric oncology centers in 18 countries, 
-encompassing 28,500 pediatric cancer cases with whole-genome sequencing (WGS) and clinical outcomes data. Using 
-secure multi-party computation and differential privacy (ε=1.2), we trained deep neural networks for cancer subtype 
-classification, treatment response prediction, and survival analysis. The architecture employed graph neural networks 
-to capture gene interaction patterns and attention mechanisms for variant prioritization. Each institution maintained 
-local data control while contributing encrypted model updates. We compared federated model performance against 
-centralized training on publicly available datasets and single-institution models.
-
-Results: The federated model achieved 92.7% accuracy for cancer subtype classification across 23 disease categories, 
-comparable to centralized training (93.1%, p=0.24) and substantially better than average single-institution performance 
-(78.3%, p<0.001). For treatment response prediction, the model reached AUROC 0.88, identifying 847 novel 
-genotype-phenotype associations including 23 actionable therapeutic targets. Survival prediction showed concordance 
-index of 0.81. The federated approach preserved privacy with formal differential privacy guarantees while enabling 
-analysis of rare disease subtypes impossible at single institutions. Model training required 6.2 days across the 
-network with 18TB of aggregate data processed locally, versus 14 months for traditional IRB approvals and data 
-transfers in historical multi-site studies.
-
-Conclusions: Federated learning enables large-scale genomic research while preserving patient privacy and institutional 
-data sovereignty, offering a scalable solution for collaborative precision medicine in rare diseases.
-        """,
-        "url": "https://www.medrxiv.org/content/10.1101/2025.05.10.25305432",
-        "published_at": "2025-05-10T00:00:00",
-        "source": "medrxiv_2025",
-        "doi": "10.1101/2025.05.10.25305432"
-    },
-    {
-        "title": "Vision-Language Models for Automated Surgical Skill Assessment and Real-Time Feedback in Robotic Surgery",
-        "authors": ["Zhang Q", "Wu T", "Chen L", "Wang F"],
-        "corresponding_author": "Zhang Q",
-        "affiliations": ["Harvard Medical School", "MIT Media Lab", "Intuitive Surgical"],
-        "abstract": """
-Background: Surgical skill assessment remains subjective and labor-intensive, limiting feedback during training. 
-We developed vision-language models for automated, objective surgical skill evaluation with real-time feedback 
-during robotic-assisted procedures.
-
-Methods: We collected 12,000 hours of da Vinci surgical system recordings across 6,800 procedures (cholecystectomy, 
-prostatectomy, hysterectomy) performed by surgeons ranging from novices (n=45) to experts (n=120). We trained a 
-multimodal transformer architecture combining surgical video analysis (CLIP-based visual encoder) with procedural 
-language understanding (GPT-4 based text encoder) to assess technical skills across 12 dimensions including instrument 
-handling, tissue manipulation, and time-motion efficiency. The model generates natural language feedback aligned with 
-OSATS (Objective Structured Assessment of Technical Skills) criteria. We validated against expert ratings (3 blinded 
-surgical educators per case) and correlated with clinical outcomes across 2,400 independent test procedures.
-
-Results: The vision-language model achieved 0.89 correlation with expert consensus scores (Spearman's ρ, 95% CI: 
-0.87-0.91) across all skill dimensions, with 94% agreement on pass/fail decisions. The model detected critical safety 
-events with 96.4% sensitivity (tissue trauma, bleeding, instrument collisions) and provided contextualized feedback 
-within 200ms latency enabling real-time intervention. Automated assessment scores predicted postoperative complications 
-(AUROC 0.82), operative time efficiency (r=0.76), and surgeon experience level with 91% accuracy. In a pilot training 
-program with 60 surgical residents, AI-powered feedback accelerated skill acquisition by 34% (p<0.001) measured by 
-time to proficiency, and improved technical skill scores by 2.8 points (5-point scale) compared to traditional 
-mentorship alone.
-
-Conclusions: Vision-language AI models enable objective, scalable surgical skill assessment with real-time feedback, 
-potentially transforming surgical education and quality assurance in the era of robotic surgery.
-        """,
-        "url": "https://www.medrxiv.org/content/10.1101/2025.08.15.25307123",
-        "published_at": "2025-08-15T00:00:00",
-        "source": "medrxiv_2025",
-        "doi": "10.1101/2025.08.15.25307123"
+from _jsonio import JSONArrayWriter, dumps_indented
+
+# Optional async HTTP client for pooled GLM connections
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional fast JSON parser/serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Sample 2025 medRxiv abstracts and their GLM-quality extractions, loaded on first use
+DATA_FILE = Path(__file__).with_name('demo_2025_data.json')
+
+# Returned when no extraction matches; read-only so it can be shared by every miss
+_FALLBACK: Mapping[str, str] = MappingProxyType({
+    "what_done": "研究详情不可用",
+    "ai_role": "AI作用未说明",
+    "models": "",
+    "data_sources": "",
+    "metrics": ""
+})
+
+# Markdown block for one article in the report
+_ARTICLE_MD = (
+    "## {_i}. {title}\n"
+    "\n"
+    "**👤 Corresponding Author:** {corresponding_author}\n"
+    "**🏥 Affiliation:** {_affil}\n"
+    "**📅 Published:** {_date} (2025)\n"
+    "**🔗 DOI:** {doi}\n"
+    "\n"
+    "### 🔍 Extracted Information\n"
+    "\n"
+    "**✓ What was done (详细描述):**\n"
+    "> {what_done}\n"
+    "\n"
+    "**✓ AI Role (AI作用):**\n"
+    "> {ai_role}\n"
+    "\n"
+    "**✓ Models/Algorithms:**\n"
+    "> {models}\n"
+    "\n"
+    "**✓ Data Sources:**\n"
+    "> {data_sources}\n"
+    "\n"
+    "**✓ Metrics:**\n"
+    "> {metrics}\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
+# Bump when the extraction prompt or schema changes to invalidate the on-disk cache
+PROMPT_VERSION = '1'
+GLM_CACHE_DIR = Path('data') / 'glm_cache'
+
+# Semantic cache settings: a near-duplicate abstract (paraphrased preprint,
+# revised version) reuses the cached extraction when cosine similarity >= threshold
+EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+SEMANTIC_THRESHOLD = 0.92
+EMBEDDING_MAX_TOKENS = 512
+_WS_RE = re.compile(r'\s+')
+
+# Extraction pipeline: concurrent extractions and completed-but-unrendered results
+MAX_CONCURRENCY = int(os.getenv('GLM_MAX_CONCURRENCY', '4'))
+QUEUE_SIZE = 8
+
+# Batched extraction: abstracts per GLM request and completion budget per abstract
+BATCH_SIZE = int(os.getenv('GLM_BATCH_SIZE', '4'))
+MAX_TOKENS_PER_ROW = 3000
+
+# Several abstracts marshaled into one user message; the system prompt is shared
+BATCH_USER_TEMPLATE = (
+    '下面共有{n}篇摘要，分别以[ROW 1]到[ROW {n}]标记。\n\n'
+    '{rows}\n\n'
+    '请对每篇摘要分别按要求提取信息，用中文详细描述研究内容和AI应用。'
+    '返回一个包含{n}个JSON对象的JSON数组，顺序与ROW编号一致。只返回JSON数组，不要其他文字。'
+)
+BATCH_ROW_TEMPLATE = '[ROW {i}] 标题：{title}\n摘要：\n"""\n{abstract}\n"""'
+
+
+@dataclass(slots=True, frozen=True)
+class Article:
+    """Metadata for one sample article."""
+    title: str
+    authors: Tuple[str, ...]
+    corresponding_author: str
+    affiliations: Tuple[str, ...]
+    abstract: str
+    url: str
+    published_at: str
+    source: str
+    doi: str
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'Article':
+        """Build a record, interning the short fields that repeat across articles."""
+        return cls(
+            title=raw['title'],
+            authors=tuple(sys.intern(s) for s in raw['authors']),
+            corresponding_author=sys.intern(raw['corresponding_author']),
+            affiliations=tuple(sys.intern(s) for s in raw['affiliations']),
+            abstract=raw['abstract'],
+            url=raw['url'],
+            published_at=raw['published_at'],
+            source=sys.intern(raw['source']),
+            doi=raw['doi'],
+        )
+
+    def to_dict(self, extraction: Mapping[str, str]) -> dict:
+        """Merge metadata and an extraction into one plain result row."""
+        row = {name: getattr(self, name) for name in self.__slots__}
+        row.update(extraction)
+        return row
+
+
+@functools.cache
+def _load_data() -> dict:
+    """Load sample articles and extraction table from the JSON asset."""
+    raw = DATA_FILE.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return {
+        'articles': [Article.from_dict(a) for a in data['articles']],
+        # Keyed by DOI; interned keys are shared by every extraction (and the merged result dicts)
+        'extractions': {
+            k: {sys.intern(field): value for field, value in v.items()}
+            for k, v in data['extractions'].items()
+        },
     }
-]
 
 
-def simulate_enhanced_extraction(abstract: str, title: str) -> dict:
+def simulate_enhanced_extraction(doi: str) -> Mapping[str, str]:
     """
     Simulate high-quality GLM extraction with detailed what_done.
     This represents what the GLM API would return.
     """
     # These are examples of what GLM-4 would extract with proper prompting
-    # what_done and ai_role are in Chinese as requested
-    enhanced_extractions = {
-        "Multimodal Large Language Models for Automated Radiology Report Generation": {
-            "what_done": "开发并验证了基于GPT-4V的多模态大语言模型，该模型处理胸部X光图像和患者病史以自动生成结构化放射学报告。模型在来自120家医院的45万对配对图像和报告上进行训练，结合检索增强生成技术参考相似病例和临床指南，并在5000个测试病例上与50名执业放射科医师进行了对比评估。",
-            "ai_role": "多模态大语言模型作为自动放射学报告生成系统提供临床决策支持，处理医学图像和文本以生成标准化诊断报告。该系统在关键发现检测方面达到94.2%的准确率，将报告生成时间从8.3分钟缩短至45秒，同时保持与经验丰富的放射科医师相当的诊断质量。",
-            "models": "GPT-4V (multimodal large language model), retrieval-augmented generation (RAG)",
-            "data_sources": "450,000 paired chest X-rays and radiology reports from 120 hospitals across three continents (2020-2024), 5,000 test cases",
-            "metrics": "BLEU-4 score 0.89, accuracy 94.2% (95% CI: 93.1-95.3), sensitivity 96.7% for pneumothorax, specificity 98.2%, inter-reader agreement kappa 0.91, time reduction from 8.3 minutes to 45 seconds, 42% reduction in door-to-diagnosis time"
-        },
-        "Foundation Models for Protein Structure Prediction": {
-            "what_done": "在真实药物发现流程中验证了AlphaFold 3的蛋白质结构预测能力，将该基础模型整合到三个治疗靶点（KRAS G12C、PCSK9、SARS-CoV-2蛋白酶）的基于结构的药物设计工作流程中。对2847个化合物的蛋白质-配体复合物进行预测，并通过X射线晶体学(n=124)和冷冻电镜(n=38)验证预测结果，与传统方法比较准确性和效率。",
-            "ai_role": "AlphaFold 3基础模型执行快速、准确的蛋白质结构和蛋白质-配体结合预测以指导药物设计决策。该AI替代了计算成本高昂的分子动力学模拟，将预测时间从72小时缩短至15分钟，同时将准确率提高34%，并将临床前候选药物鉴定加速8-14个月。",
-            "models": "AlphaFold 3 (foundation model for protein structure prediction)",
-            "data_sources": "2,847 compounds for three therapeutic targets (KRAS G12C, PCSK9, SARS-CoV-2 protease), validation with 124 X-ray crystallography structures and 38 cryo-EM structures, retrospective analysis of 18 drug discovery programs (2020-2024)",
-            "metrics": "1.8Å median RMSD for backbone prediction, 2.4Å for ligand binding poses (34% improvement), pLDDT >90 with 97% correlation to experimental validation, 2.3× higher success rate in lead optimization (45% vs 19%, p<0.001), reduced optimization cycles from 4.2 to 2.7, 95% reduction in computational resources"
-        },
-        "Real-World Implementation of AI-Powered Sepsis Prediction in ICUs": {
-            "what_done": "在24家医院开展多中心随机对照试验，纳入12450名ICU患者以评估AI驱动的脓毒症早期预警系统。开发了基于Transformer的深度学习模型，在38万次ICU入院数据上训练，分析来自电子病历系统的147个实时临床变量，以在临床标准出现前6-12小时预测脓毒症发作。",
-            "ai_role": "基于Transformer的AI系统提供实时脓毒症风险预测以实现早期干预，分析生命体征、实验室结果、用药和护理记录的连续数据流。该系统实现了提前6小时预测且AUROC达0.94，将28天死亡率从14.2%降至11.3%，并将抗生素给药时间从3.2小时缩短至1.8小时。",
-            "models": "Transformer-based deep learning with temporal convolutional networks and attention mechanisms",
-            "data_sources": "Training: 380,000 ICU admissions; RCT: 12,450 ICU patients across 24 hospitals (June 2024-January 2025), 147 real-time clinical variables from EHR streams",
-            "metrics": "AUROC 0.94 (95% CI: 0.93-0.95) for 6-hour prediction, 87% sensitivity at 90% specificity, 28-day mortality reduction from 14.2% to 11.3% (ARR 2.9%, p=0.002, NNT=34), time to antibiotics reduced from 3.2 to 1.8 hours, 24% reduction in ICU length of stay, $8,400 cost savings per patient, PPV 31%, false positive rate 12%"
-        },
-        "Federated Learning for Privacy-Preserving Genomic Analysis": {
-            "what_done": "在18个国家的42个儿科肿瘤中心建立联邦学习网络，在不共享原始患者数据的情况下对28500例儿科癌症病例的全基因组测序数据进行协作基因组分析。使用安全多方计算和差分隐私(ε=1.2)训练深度神经网络进行癌症亚型分类、治疗反应预测和生存分析，同时保持机构数据主权。",
-            "ai_role": "联邦学习实现了保护隐私的协作AI模型训练，各机构贡献加密的模型更新而非共享敏感基因组数据。该方法允许分析单个机构无法完成的罕见儿科癌症，同时保持正式的差分隐私保证，发现了847个新的基因型-表型关联，包括23个可操作的治疗靶点。",
-            "models": "Graph neural networks with attention mechanisms, secure multi-party computation, differential privacy (ε=1.2)",
-            "data_sources": "28,500 pediatric cancer cases with whole-genome sequencing from 42 centers in 18 countries, 18TB aggregate data processed locally",
-            "metrics": "92.7% accuracy for cancer subtype classification (vs 93.1% centralized, p=0.24; vs 78.3% single-institution, p<0.001), AUROC 0.88 for treatment response, concordance index 0.81 for survival, 847 novel associations discovered including 23 actionable targets, 6.2 days training time vs 14 months for traditional multi-site approvals"
-        },
-        "Vision-Language Models for Automated Surgical Skill Assessment": {
-            "what_done": "开发并验证了结合手术视频分析（基于CLIP）和程序语言理解（基于GPT-4）的多模态Transformer架构，用于自动评估12个维度的技术手术技能。在从新手到专家外科医生完成的6800例手术的12000小时达芬奇手术录像上进行训练，并通过专家评分验证且与2400例独立测试手术的临床结果相关联。",
-            "ai_role": "视觉-语言AI模型在机器人手术过程中提供自动化、客观的手术技能评估和实时自然语言反馈。它分析手术视频以评估符合OSATS标准的技术技能（器械操作、组织处理、效率），检测关键安全事件，并在200毫秒延迟内生成情境化反馈以实现实时干预和加速手术培训。",
-            "models": "Multimodal transformer architecture with CLIP-based visual encoder and GPT-4 based text encoder",
-            "data_sources": "12,000 hours of da Vinci surgical recordings from 6,800 procedures (cholecystectomy, prostatectomy, hysterectomy), 45 novice to 120 expert surgeons, validation on 2,400 independent procedures with expert ratings",
-            "metrics": "0.89 correlation with expert consensus (Spearman's ρ, 95% CI: 0.87-0.91), 94% pass/fail agreement, 96.4% sensitivity for critical safety events, 200ms latency for real-time feedback, AUROC 0.82 for complication prediction, r=0.76 for operative efficiency, 91% accuracy for experience level, 34% faster skill acquisition (p<0.001), 2.8-point improvement on 5-point skill scale"
-        }
-    }
-    
-    # Find matching extraction
-    for key in enhanced_extractions:
-        if key in title:
-            return enhanced_extractions[key]
-    
-    # Fallback (shouldn't happen with our controlled data)
-    return {
-        "what_done": "研究详情不可用",
-        "ai_role": "AI作用未说明",
-        "models": "",
-        "data_sources": "",
-        "metrics": ""
-    }
+    # what_done and ai_role are in Chinese as requested.
+    # Fallback shouldn't happen with our controlled data.
+    return _load_data()['extractions'].get(doi, _FALLBACK)
 
 
-def main():
-    """Run enhanced demonstration with 2025 articles and GLM-quality extraction."""
-    print("=" * 100)
-    print("medRxiv AI Article Extraction - 2025 Articles with GLM-4 Quality")
-    print("=" * 100)
-    print()
-    print("This demo shows extraction results from 2025 medRxiv AI papers.")
-    print("Extraction quality simulates GLM-4 API with detailed what_done descriptions.")
-    print()
-    print("=" * 100)
-    print()
-    
-    # Initialize extractor
-    extractor = LLMExtractor()
-    
-    print(f"Processing {len(SAMPLE_ABSTRACTS_2025)} articles from 2025...")
-    print()
-    
-    results = []
-    
-    for i, article in enumerate(SAMPLE_ABSTRACTS_2025, 1):
-        print(f"\n{'=' * 100}")
-        print(f"ARTICLE {i}/{len(SAMPLE_ABSTRACTS_2025)}")
-        print('=' * 100)
-        print()
-        print(f"📄 Title: {article['title']}")
-        print(f"👤 Author: {article['corresponding_author']}")
-        print(f"🏥 Affiliation: {', '.join(article['affiliations'])}")
-        print(f"📅 Published: {article['published_at'][:10]} (2025)")
-        print(f"🔗 DOI: {article['doi']}")
-        print()
-        
-        # Use enhanced extraction (simulating GLM-4 quality)
-        extraction = simulate_enhanced_extraction(article['abstract'], article['title'])
-        
+def _canonicalize(text: str) -> str:
+    """Collapse runs of whitespace and strip, so layout noise doesn't change cache keys."""
+    return _WS_RE.sub(' ', text).strip()
+
+
+class ExtractionCache:
+    """
+    Tiered extraction cache: exact content hash, on-disk by DOI, then embedding similarity.
+
+    The disk tier is used only when cache_dir is given and persists results
+    across runs, keyed by DOI and PROMPT_VERSION. The semantic tier is opt-in
+    (semantic=True) and needs faiss and sentence-transformers; the embedding
+    model is only loaded on the first miss, and without the packages the tier
+    is skipped.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        semantic: bool = False,
+        model_name: str = EMBEDDING_MODEL,
+        threshold: float = SEMANTIC_THRESHOLD
+    ):
+        self.exact = {}
+        self.cache_dir = cache_dir
+        self.semantic = semantic
+        self.model_name = model_name
+        self.ids = []  # exact keys in FAISS index order
+        self._vectors = {}
+        self.threshold = threshold
+        self.model = None
+        self.index = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def _semantic_index(self):
+        """FAISS index of cached embeddings, loaded on first use; None when the tier is off."""
+        if self.index is None and self.semantic:
+            try:
+                import faiss
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                self.semantic = False
+                return None
+            self.model = SentenceTransformer(self.model_name)
+            self.index = faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+        return self.index
+
+    def _disk_path(self, article: Article) -> Optional[Path]:
+        """Cache file for article, or None when the disk tier is off or there's no DOI."""
+        if self.cache_dir is None or not article.doi:
+            return None
+        digest = hashlib.sha256(f"{article.doi}{PROMPT_VERSION}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    @staticmethod
+    def _key(article: Article) -> bytes:
+        """Exact-match key over whitespace-canonicalized title and abstract."""
+        text = f"{_canonicalize(article.title)}\x1f{_canonicalize(article.abstract)}"
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def _embed(self, article: Article):
+        """L2-normalized embedding of title + first tokens of the abstract."""
+        tokens = _canonicalize(article.abstract).split(' ')[:EMBEDDING_MAX_TOKENS]
+        text = f"{_canonicalize(article.title)}\n{' '.join(tokens)}"
+        return self.model.encode([text], normalize_embeddings=True).astype('float32')
+
+    def get(self, article: Article):
+        """Return the cached extraction for article, or None on a true miss."""
+        key = self._key(article)
+        if key in self.exact:
+            self.hits += 1
+            return self.exact[key]
+
+        path = self._disk_path(article)
+        if path is not None and path.exists():
+            self.disk_hits += 1
+            extraction = json.loads(path.read_bytes())
+            self.exact[key] = extraction
+            return extraction
+
+        index = self._semantic_index()
+        if index is not None:
+            vector = self._embed(article)
+            if index.ntotal:
+                scores, positions = index.search(vector, 1)
+                if scores[0][0] >= self.threshold:
+                    self.semantic_hits += 1
+                    extraction = self.exact[self.ids[positions[0][0]]]
+                    self.exact[key] = extraction
+                    return extraction
+            # Keep the embedding so put() doesn't encode the abstract twice
+            self._vectors[key] = vector
+
+        self.misses += 1
+        return None
+
+    def put(self, article: Article, extraction: dict):
+        """Store a freshly extracted result in every enabled tier."""
+        key = self._key(article)
+        self.exact[key] = extraction
+        path = self._disk_path(article)
+        if path is not None:
+            # Write-then-rename so a concurrent or interrupted run never sees a partial file;
+            # each writer gets its own temporary name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(dumps_indented(dict(extraction)))
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        index = self._semantic_index()
+        if index is not None:
+            vector = self._vectors.pop(key, None)
+            if vector is None:
+                vector = self._embed(article)
+            index.add(vector)
+            self.ids.append(key)
+
+
+@functools.cache
+def _glm_modules():
+    """
+    Import the GLM extractor stack on first use.
+
+    The simulated demo never touches it, so its HTTP/SDK imports are only
+    paid for with --use-real-glm.
+
+    Returns:
+        Tuple of (glm_client, llm_extractor) modules
+    """
+    try:
+        from medrxiv_ai import glm_client, llm_extractor
+    except ImportError:
+        # Not installed (pip install -e .); import straight from the source tree
+        sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+        import glm_client
+        import llm_extractor
+    return glm_client, llm_extractor
+
+
+def _parse_rows(content: str, n: int) -> list:
+    """Parse a JSON array of n extraction objects from a batched GLM response."""
+    try:
+        rows = _loads(content.strip())
+    except json.JSONDecodeError:
+        # Tolerate a markdown code fence or leading/trailing prose
+        match = re.search(r'\[.*\]', content, re.DOTALL)
+        if not match:
+            raise ValueError(f"Could not parse JSON array from response: {content[:200]}")
+        rows = _loads(match.group(0))
+    if not isinstance(rows, list) or len(rows) != n:
+        raise ValueError(f"Expected a JSON array of {n} objects, got: {content[:200]}")
+    return rows
+
+
+class AsyncGLM:
+    """
+    Async GLM chat completions over one pooled aiohttp session.
+
+    Connections (and their TLS sessions) are reused across every request in
+    the run. Without aiohttp installed, requests fall back to the blocking
+    GLMClient in worker threads.
+    """
+
+    def __init__(self, extractor):
+        self.extractor = extractor  # GLM -> OpenAI -> heuristic chain for single abstracts
+        self.client = extractor.glm_client  # configuration plus response validation
+        self.session = None
+        if aiohttp is not None:
+            # Auth headers and timeouts are set per request by GLMClient._make_request_async
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+            )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+    async def chat(self, messages: list, max_tokens: int) -> dict:
+        """POST one chat completion, retrying 429/5xx with exponential backoff."""
+        if self.session is None:
+            return await asyncio.to_thread(
+                self.client._make_request, messages, temperature=0.0, max_tokens=max_tokens
+            )
+        return await self.client._make_request_async(
+            self.session, messages, temperature=0.0, max_tokens=max_tokens
+        )
+
+    async def extract_one(self, abstract: str) -> Tuple[dict, bool]:
+        """
+        Extract a single abstract through the extractor's full fallback chain.
+
+        Returns:
+            Tuple of (extraction, needs_manual_review)
+        """
+        result, needs_review, _ = await self.extractor.extract_async(abstract, self.session)
+        return result, needs_review
+
+
+async def extract_with_glm(articles: list, glm: AsyncGLM, batch_size: int = BATCH_SIZE) -> list:
+    """
+    Extract several articles per GLM request by row-marshaling abstracts into one prompt.
+
+    A batch whose response is unusable (request failed, not JSON, wrong row
+    count) is extracted again one abstract at a time, so a single bad
+    response never ends the run.
+
+    Args:
+        articles: Articles to extract
+        glm: AsyncGLM connection
+        batch_size: Abstracts per request
+
+    Returns:
+        (extraction, needs_manual_review, cacheable) tuples, in the same order
+        as articles. Only rows from a usable batched response are cacheable;
+        results of the one-by-one fallback may come from OpenAI or the
+        heuristic extractor and must not outlive the run.
+    """
+    extractions = []
+    for start in range(0, len(articles), batch_size):
+        batch = articles[start:start + batch_size]
+        rows = '\n\n'.join(
+            BATCH_ROW_TEMPLATE.format(i=i, title=a.title, abstract=a.abstract)
+            for i, a in enumerate(batch, 1)
+        )
+        messages = [
+            {'role': 'system', 'content': _glm_modules()[0].SYSTEM_PROMPT},
+            {'role': 'user', 'content': BATCH_USER_TEMPLATE.format(n=len(batch), rows=rows)}
+        ]
+        try:
+            response = await glm.chat(messages, max_tokens=MAX_TOKENS_PER_ROW * len(batch))
+            content = response['choices'][0]['message']['content']
+            rows = [
+                (glm.client._validate_extraction_result(row), False, True)
+                for row in _parse_rows(content, len(batch))
+            ]
+        except Exception as e:
+            print(f"Batched GLM response unusable ({e}); extracting {len(batch)} abstracts one by one",
+                  file=sys.stderr)
+            singles = await asyncio.gather(*(glm.extract_one(a.abstract) for a in batch))
+            rows = [(extraction, needs_review, False) for extraction, needs_review in singles]
+        extractions.extend(rows)
+    return extractions
+
+
+async def extract_batch(batch: list, cache: ExtractionCache, glm: Optional[AsyncGLM] = None) -> list:
+    """
+    Extract a batch of articles, serving cache hits locally.
+
+    With a GLM connection the cache misses share one batched request; without
+    one the simulated extraction is used. Fallback results are returned but
+    never cached, so a later run asks GLM again.
+
+    Returns:
+        (extraction, needs_manual_review) pairs, in the same order as batch
+    """
+    extractions = [cache.get(article) for article in batch]
+    results = [(extraction, False) for extraction in extractions]
+    misses = [i for i, extraction in enumerate(extractions) if extraction is None]
+    if misses:
+        todo = [batch[i] for i in misses]
+        if glm is not None:
+            fresh = await extract_with_glm(todo, glm, len(todo))
+        else:
+            fresh = [(simulate_enhanced_extraction(a.doi), False, True) for a in todo]
+        for i, (extraction, needs_review, cacheable) in zip(misses, fresh):
+            if cacheable:
+                cache.put(batch[i], extraction)
+            results[i] = (extraction, needs_review)
+    return results
+
+
+async def iter_extractions(
+    articles,
+    extract,
+    batch_size: int = BATCH_SIZE,
+    max_concurrency: int = MAX_CONCURRENCY
+):
+    """
+    Yield (article, extraction) pairs in input order while batches are extracted concurrently.
+
+    At most max_concurrency batches run at once (keeps GLM under its
+    request-rate ceiling). Producers push completed extractions onto a bounded
+    queue; the consumer reorders them so output for article N can be rendered
+    while later articles are still being extracted.
+    """
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def produce(start, batch):
+        try:
+            async with semaphore:
+                results = await extract(batch)
+        except Exception as e:
+            results = [e] * len(batch)
+        for offset, (article, result) in enumerate(zip(batch, results)):
+            await queue.put((start + offset, article, result))
+
+    producers = asyncio.ensure_future(asyncio.gather(*(
+        produce(start, articles[start:start + batch_size])
+        for start in range(0, len(articles), batch_size)
+    )))
+    pending = {}
+    try:
+        for index in range(len(articles)):
+            while index not in pending:
+                done_index, article, result = await queue.get()
+                pending[done_index] = (article, result)
+            article, result = pending.pop(index)
+            if isinstance(result, Exception):
+                raise result
+            yield article, result
+        await producers
+    finally:
+        if not producers.done():
+            producers.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producers
+
+
+def render_article(
+    i: int, total: int, article: Article, extraction: Mapping[str, str], needs_review: bool = False
+) -> str:
+    """Format the console block for one article."""
+    rule = '=' * 100
+    review = (
+        "Yes (GLM extraction failed, fallback result)" if needs_review
+        else "No (GLM-4 high quality extraction)"
+    )
+    return (
+        f"\n{rule}\n"
+        f"ARTICLE {i}/{total}\n"
+        f"{rule}\n"
+        "\n"
+        f"📄 Title: {article.title}\n"
+        f"👤 Author: {article.corresponding_author}\n"
+        f"🏥 Affiliation: {', '.join(article.affiliations)}\n"
+        f"📅 Published: {article.published_at[:10]} (2025)\n"
+        f"🔗 DOI: {article.doi}\n"
+        "\n"
+        "🔍 EXTRACTED INFORMATION (GLM-4 Quality):\n"
+        f"{'-' * 100}\n"
+        "✓ What was done (详细描述):\n"
+        f"  {extraction['what_done']}\n"
+        "\n"
+        "✓ AI Role (AI作用):\n"
+        f"  {extraction['ai_role']}\n"
+        "\n"
+        "✓ Models/Algorithms:\n"
+        f"  {extraction['models']}\n"
+        "\n"
+        "✓ Data Sources:\n"
+        f"  {extraction['data_sources']}\n"
+        "\n"
+        "✓ Metrics:\n"
+        f"  {extraction['metrics']}\n"
+        "\n"
+        f"⚠️  Needs Manual Review: {review}\n"
+        "\n"
+    )
+
+
+def _emit(block: str):
+    """Write a preformatted block to stdout with one encode and one write."""
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        sys.stdout.write(block)
+        return
+    # Any pending print() output must reach the byte stream first
+    sys.stdout.flush()
+    out.write(block.encode(sys.stdout.encoding or 'utf-8', sys.stdout.errors or 'strict'))
+    out.flush()
+
+
+@contextlib.contextmanager
+def _atomic_output(path: Path, mode: str, **kwargs):
+    """Open a temporary file beside path; it replaces path only if the block completes."""
+    f = tempfile.NamedTemporaryFile(
+        mode, dir=path.parent, prefix=path.name + '.', suffix='.tmp', delete=False, **kwargs
+    )
+    try:
+        with f:
+            yield f
+        # NamedTemporaryFile is owner-only; give the output the mode a plain open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(f.name, 0o666 & ~umask)
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+
+async def process_articles(
+    articles,
+    cache: ExtractionCache,
+    json_out,
+    md_out=None,
+    glm: Optional[AsyncGLM] = None,
+    quiet: bool = False,
+) -> int:
+    """
+    Extract all articles concurrently, displaying and saving each one as soon as it is ready.
+
+    Results are streamed to json_out (a JSONArrayWriter) and md_out (the
+    markdown report body, skipped when None) in input order, so no full
+    result list is kept. With quiet=True the per-article console block is
+    not rendered.
+
+    Returns:
+        Tuple of (articles processed, articles needing manual review)
+    """
+    i = flagged = 0
+    async for article, (extraction, needs_review) in iter_extractions(
+        articles, functools.partial(extract_batch, cache=cache, glm=glm)
+    ):
+        i += 1
+        flagged += needs_review
         # Combine with metadata
-        result = {
-            **article,
-            **extraction,
-            'needs_manual_review': False  # GLM quality doesn't need review
-        }
-        results.append(result)
+        result = article.to_dict(extraction)
+        result['needs_manual_review'] = needs_review  # only fallback extractions need review
+        json_out.write(result)
+        if md_out is not None:
+            md_out.write(render_report_article(i, result))
         
         # Display extracted information with enhanced detail
-        print("🔍 EXTRACTED INFORMATION (GLM-4 Quality):")
-        print("-" * 100)
-        print(f"✓ What was done (详细描述):")
-        print(f"  {extraction['what_done']}")
-        print()
-        print(f"✓ AI Role (AI作用):")
-        print(f"  {extraction['ai_role']}")
-        print()
-        print(f"✓ Models/Algorithms:")
-        print(f"  {extraction['models']}")
-        print()
-        print(f"✓ Data Sources:")
-        print(f"  {extraction['data_sources']}")
-        print()
-        print(f"✓ Metrics:")
-        print(f"  {extraction['metrics']}")
-        print()
-        print(f"⚠️  Needs Manual Review: No (GLM-4 high quality extraction)")
-        print()
+        if not quiet:
+            _emit(render_article(i, len(articles), article, extraction, needs_review))
     
-    # Summary
-    print("\n" + "=" * 100)
-    print("EXTRACTION SUMMARY")
-    print("=" * 100)
-    print()
-    print(f"Total 2025 articles processed: {len(results)}")
-    print(f"Articles needing review: 0 (all GLM-4 quality)")
-    print(f"All extractions include detailed what_done descriptions")
-    print()
+    return i, flagged
+
+
+def parse_args(argv=None):
+    """Parse command-line options; the defaults reproduce the interactive demo."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--quiet', action='store_true',
+                        help='Do not print the per-article extraction details')
+    parser.add_argument('--no-markdown', action='store_true',
+                        help='Skip writing the markdown report (JSON results only)')
+    parser.add_argument('--use-real-glm', action='store_true',
+                        help='Extract with the GLM API (needs GLM_API_KEY) instead of the simulated results')
+    parser.add_argument('--semantic-cache', action='store_true',
+                        help='Reuse extractions of near-duplicate abstracts by embedding similarity '
+                             '(needs faiss and sentence-transformers; loads the model on the first cache miss)')
+    return parser.parse_args(argv)
+
+
+async def main(args=None):
+    """Run enhanced demonstration with 2025 articles and GLM-quality extraction."""
+    if args is None:
+        args = parse_args()
+    rule = '=' * 100
+    _emit(
+        f"{rule}\n"
+        "medRxiv AI Article Extraction - 2025 Articles with GLM-4 Quality\n"
+        f"{rule}\n"
+        "\n"
+        "This demo shows extraction results from 2025 medRxiv AI papers.\n"
+        "Extraction quality simulates GLM-4 API with detailed what_done descriptions.\n"
+        "\n"
+        f"{rule}\n"
+        "\n"
+    )
+    
+    # The real extractor is only imported and constructed on request
+    extractor = glm_client = None
+    if args.use_real_glm:
+        extractor = _glm_modules()[1].LLMExtractor()
+        glm_client = extractor.glm_client
+    # Only real GLM results are worth persisting across runs
+    cache = ExtractionCache(
+        GLM_CACHE_DIR if glm_client is not None else None,
+        semantic=args.semantic_cache,
+    )
+    
+    articles = _load_data()['articles']
     
-    # Save results
+    # Output location and run timestamp are fixed for the whole run
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d-%H%M%S')
     demo_dir = Path('data')
     demo_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
     demo_json = demo_dir / f'medrxiv-ai-{timestamp}-enhanced.json'
-    with open(demo_json, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    
-    print(f"✓ Results saved to: {demo_json}")
-    print()
-    
-    # Create detailed markdown report
-    md_content = generate_markdown_report(results, timestamp)
     demo_md = demo_dir / f'medrxiv-ai-{timestamp}-enhanced.md'
-    with open(demo_md, 'w', encoding='utf-8') as f:
-        f.write(md_content)
-    
-    print(f"✓ Report saved to: {demo_md}")
-    print()
     
-    print("=" * 100)
-    print("DEMO COMPLETE - 2025 Articles with Enhanced Detail")
-    print("=" * 100)
-    print()
-    print("✓ All 5 articles from 2025 processed successfully")
-    print("✓ Detailed what_done descriptions provided by GLM-4 quality extraction")
-    print("✓ Complete metadata, models, data sources, and metrics extracted")
-    print()
-
-
-def generate_markdown_report(results, timestamp):
-    """Generate detailed markdown report."""
-    lines = [
-        "# medRxiv AI Articles - 2025 Enhanced Extraction Results",
-        "",
-        f"**Generated:** {datetime.now().isoformat()}Z",
-        f"**Total Articles:** {len(results)} from 2025",
-        "**Extraction Quality:** GLM-4 Level (Detailed)",
-        "",
-        "---",
-        ""
-    ]
+    status = f"Processing {len(articles)} articles from 2025...\n"
+    if glm_client is not None:
+        status += (
+            f"Extraction: GLM API ({glm_client.model_name}), "
+            f"{BATCH_SIZE} abstracts per request, up to {MAX_CONCURRENCY} concurrent requests\n"
+        )
+    elif args.use_real_glm:
+        status += "Extraction: GLM API not configured (set GLM_API_KEY), using simulated results\n"
+    _emit(status + "\n")
     
-    for i, article in enumerate(results, 1):
-        lines.extend([
-            f"## {i}. {article['title']}",
-            "",
-            f"**👤 Corresponding Author:** {article['corresponding_author']}",
-            f"**🏥 Affiliation:** {', '.join(article['affiliations'])}",
-            f"**📅 Published:** {article['published_at'][:10]} (2025)",
-            f"**🔗 DOI:** {article['doi']}",
-            "",
-            "### 🔍 Extracted Information",
-            "",
-            "**✓ What was done (详细描述):**",
-            f"> {article['what_done']}",
-            "",
-            "**✓ AI Role (AI作用):**",
-            f"> {article['ai_role']}",
-            "",
-            "**✓ Models/Algorithms:**",
-            f"> {article['models']}",
-            "",
-            "**✓ Data Sources:**",
-            f"> {article['data_sources']}",
-            "",
-            "**✓ Metrics:**",
-            f"> {article['metrics']}",
-            "",
-            "---",
-            ""
-        ])
+    # Results and the detailed markdown report are written as articles complete
+    glm = AsyncGLM(extractor) if glm_client is not None else None
+    try:
+        with contextlib.ExitStack() as stack:
+            # Written to temporary files that replace the outputs only after a complete run
+            json_out = JSONArrayWriter(stack.enter_context(_atomic_output(demo_json, 'wb')))
+            mf = None
+            if not args.no_markdown:
+                mf = stack.enter_context(_atomic_output(demo_md, 'w', encoding='utf-8'))
+                mf.write(render_report_header(len(articles), now.isoformat()))
+            total, flagged = await process_articles(articles, cache, json_out, mf, glm, quiet=args.quiet)
+            json_out.close()
+            if mf is not None:
+                mf.write(render_report_footer(total, timestamp, flagged))
+    finally:
+        if glm is not None:
+            await glm.close()
     
-    lines.extend([
-        "",
-        "## Summary",
-        "",
-        f"- **Total 2025 articles:** {len(results)}",
-        "- **Extraction quality:** GLM-4 level with detailed descriptions",
-        "- **Manual review needed:** 0 (all high quality)",
-        "",
-        "---",
+    # Summary
+    report_saved = "" if args.no_markdown else f"✓ Report saved to: {demo_md}\n\n"
+    _emit(
+        f"\n{rule}\n"
+        "EXTRACTION SUMMARY\n"
+        f"{rule}\n"
+        "\n"
+        f"Total 2025 articles processed: {total}\n"
+        f"Articles needing review: {_review_note(flagged, 'all GLM-4 quality')}\n"
+        "All extractions include detailed what_done descriptions\n"
+        f"Cache: {cache.misses} extracted, {cache.hits} exact hits, "
+        f"{cache.disk_hits} disk hits, {cache.semantic_hits} semantic hits\n"
+        "\n"
+        f"✓ Results saved to: {demo_json}\n"
+        "\n"
+        f"{report_saved}"
+        f"{rule}\n"
+        "DEMO COMPLETE - 2025 Articles with Enhanced Detail\n"
+        f"{rule}\n"
+        "\n"
+        "✓ All 5 articles from 2025 processed successfully\n"
+        "✓ Detailed what_done descriptions provided by GLM-4 quality extraction\n"
+        "✓ Complete metadata, models, data sources, and metrics extracted\n"
+        "\n"
+    )
+
+
+def render_report_header(total: int, now_iso: str) -> str:
+    """Markdown report title block."""
+    return (
+        "# medRxiv AI Articles - 2025 Enhanced Extraction Results\n"
+        "\n"
+        f"**Generated:** {now_iso}Z\n"
+        f"**Total Articles:** {total} from 2025\n"
+        "**Extraction Quality:** GLM-4 Level (Detailed)\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
+
+
+def render_report_article(i: int, article: dict) -> str:
+    """Markdown report section for one result row."""
+    ctx = {
+        **article,
+        '_i': i,
+        '_affil': ', '.join(article['affiliations']),
+        '_date': article['published_at'][:10],
+    }
+    return _ARTICLE_MD.format_map(ctx)
+
+
+def _review_note(flagged: int, clean: str) -> str:
+    """Count of articles needing manual review, with a short reason."""
+    if flagged:
+        return f"{flagged} (GLM extraction failed, fallback results)"
+    return f"0 ({clean})"
+
+
+def render_report_footer(total: int, timestamp: str, flagged: int = 0) -> str:
+    """Markdown report summary block."""
+    return (
+        "\n"
+        "## Summary\n"
+        "\n"
+        f"- **Total 2025 articles:** {total}\n"
+        "- **Extraction quality:** GLM-4 level with detailed descriptions\n"
+        f"- **Manual review needed:** {_review_note(flagged, 'all high quality')}\n"
+        "\n"
+        "---\n"
         f"*Generated: {timestamp} | GLM-4 Enhanced Extraction*"
-    ])
-    
-    return '\n'.join(lines)
+    )
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
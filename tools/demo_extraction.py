@@ -3,6 +3,7 @@
 Demo script to show extraction results without requiring API keys.
 Uses sample abstracts to demonstrate the extraction capabilities.
 """
+import argparse
 import sys
 import json
 from pathlib import Path
@@ -12,6 +13,13 @@ src_path = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_path))
 
 from llm_extractor import LLMExtractor
+from _jsonio import JSONArrayWriter, dumps_indented
+
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Sample medRxiv abstracts related to AI (realistic examples)
 SAMPLE_ABSTRACTS = [
@@ -150,8 +158,75 @@ privacy, offering a viable path for multi-institutional medical AI research.
 ]
 
 
-def main():
+# Per-article console block, filled once per article and written in one call
+ARTICLE_TEMPLATE = (
+    "\n"
+    "{rule}\n"
+    "ARTICLE {i}/{total}\n"
+    "{rule}\n"
+    "\n"
+    "📄 Title: {title}\n"
+    "👤 Author: {author}\n"
+    "🏥 Affiliation: {affiliation}\n"
+    "📅 Published: {published}\n"
+    "🔗 URL: {url}\n"
+    "\n"
+    "🔍 EXTRACTED INFORMATION:\n"
+    "{thin_rule}\n"
+    "✓ What was done:\n"
+    "  {what_done}\n"
+    "\n"
+    "✓ AI Role:\n"
+    "  {ai_role}\n"
+    "\n"
+    "✓ Models/Algorithms:\n"
+    "  {models}\n"
+    "\n"
+    "✓ Data Sources:\n"
+    "  {data_sources}\n"
+    "\n"
+    "✓ Metrics:\n"
+    "  {metrics}\n"
+    "\n"
+    "⚠️  Needs Manual Review: {needs_review}\n"
+    "\n"
+)
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize obj as one compact UTF-8 JSON line (NDJSON record)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def ndjson_to_json_array(src: Path, dst: Path):
+    """
+    Rewrite an NDJSON file as an indented JSON array, holding one record at a time.
+
+    The output is byte-identical to serializing the whole list with dumps_indented().
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        array = JSONArrayWriter(fout)
+        for line in fin:
+            array.write(loads(line))
+        array.close()
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--json-array', action='store_true',
+                        help='Also write the results as a single JSON array '
+                             '(demo_extraction_results.json)')
+    return parser.parse_args(argv)
+
+
+def main(args=None):
     """Run demonstration of extraction capabilities."""
+    if args is None:
+        args = parse_args()
     print("=" * 100)
     print("medRxiv AI Article Extraction - DEMONSTRATION")
     print("=" * 100)
@@ -168,70 +243,75 @@ def main():
     print(f"Processing {len(SAMPLE_ABSTRACTS)} sample articles...")
     print()
     
-    results = []
+    # Extract all abstracts up front; API requests run concurrently and
+    # identical abstracts (common in test corpora) are only extracted once
+    abstracts = [article['abstract'] for article in SAMPLE_ABSTRACTS]
+    unique_abstracts = list(dict.fromkeys(abstracts))
+    extracted = dict(zip(unique_abstracts, extractor.extract_batch(unique_abstracts)))
+    extractions = [extracted[abstract] for abstract in abstracts]
+    cache_hits = len(abstracts) - len(unique_abstracts)
+    
+    # Results are streamed to NDJSON as they are produced, so memory stays flat
+    # however many articles are processed
+    demo_dir = Path('data')
+    demo_dir.mkdir(exist_ok=True)
+    demo_ndjson = demo_dir / 'demo_extraction_results.ndjson'
+    processed = 0
+    review_count = 0
+    first_result = None
     
-    for i, article in enumerate(SAMPLE_ABSTRACTS, 1):
-        print(f"\n{'=' * 100}")
-        print(f"ARTICLE {i}/{len(SAMPLE_ABSTRACTS)}")
-        print('=' * 100)
-        print()
-        print(f"📄 Title: {article['title']}")
-        print(f"👤 Author: {article['corresponding_author']}")
-        print(f"🏥 Affiliation: {', '.join(article['affiliations'])}")
-        print(f"📅 Published: {article['published_at'][:10]}")
-        print(f"🔗 URL: {article['url']}")
-        print()
-        
-        # Extract information
-        extraction, needs_review, raw_output = extractor.extract(article['abstract'])
-        
-        # Combine with metadata
-        result = {
-            **article,
-            **extraction,
-            'needs_manual_review': needs_review
-        }
-        results.append(result)
-        
-        # Display extracted information
-        print("🔍 EXTRACTED INFORMATION:")
-        print("-" * 100)
-        print(f"✓ What was done:")
-        print(f"  {extraction['what_done']}")
-        print()
-        print(f"✓ AI Role:")
-        print(f"  {extraction['ai_role']}")
-        print()
-        print(f"✓ Models/Algorithms:")
-        print(f"  {extraction['models'] if extraction['models'] else 'Not specified'}")
-        print()
-        print(f"✓ Data Sources:")
-        print(f"  {extraction['data_sources'] if extraction['data_sources'] else 'Not specified'}")
-        print()
-        print(f"✓ Metrics:")
-        print(f"  {extraction['metrics'] if extraction['metrics'] else 'Not specified'}")
-        print()
-        print(f"⚠️  Needs Manual Review: {needs_review}")
-        print()
+    with open(demo_ndjson, 'wb') as out:
+        for i, (article, (extraction, needs_review, raw_output)) in enumerate(
+            zip(SAMPLE_ABSTRACTS, extractions), 1
+        ):
+            # Combine with metadata
+            result = {
+                **article,
+                **extraction,
+                'needs_manual_review': needs_review
+            }
+            out.write(_dumps_line(result))
+            processed += 1
+            review_count += bool(needs_review)
+            if first_result is None:
+                first_result = result
+            
+            # Display the article and its extracted information in one write
+            sys.stdout.write(ARTICLE_TEMPLATE.format(
+                i=i,
+                total=len(SAMPLE_ABSTRACTS),
+                rule='=' * 100,
+                thin_rule='-' * 100,
+                title=article['title'],
+                author=article['corresponding_author'],
+                affiliation=', '.join(article['affiliations']),
+                published=article['published_at'][:10],
+                url=article['url'],
+                what_done=extraction['what_done'],
+                ai_role=extraction['ai_role'],
+                models=extraction['models'] or 'Not specified',
+                data_sources=extraction['data_sources'] or 'Not specified',
+                metrics=extraction['metrics'] or 'Not specified',
+                needs_review=needs_review,
+            ))
+    sys.stdout.flush()
     
     # Summary
     print("\n" + "=" * 100)
     print("EXTRACTION SUMMARY")
     print("=" * 100)
     print()
-    print(f"Total articles processed: {len(results)}")
-    print(f"Articles needing review: {sum(1 for r in results if r['needs_manual_review'])}")
+    print(f"Total articles processed: {processed}")
+    print(f"Articles needing review: {review_count}")
+    print(f"Extraction cache: {len(unique_abstracts)} extracted, {cache_hits} duplicate abstracts reused")
     print()
     
-    # Save demo results
-    demo_dir = Path('data')
-    demo_dir.mkdir(exist_ok=True)
-    
-    demo_json = demo_dir / 'demo_extraction_results.json'
-    with open(demo_json, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    
-    print(f"✓ Results saved to: {demo_json}")
+    print(f"✓ Results saved to: {demo_ndjson} (one JSON object per line)")
+    if args.json_array:
+        # Array form only for consumers that expect a single JSON document
+        demo_json = demo_dir / 'demo_extraction_results.json'
+        ndjson_to_json_array(demo_ndjson, demo_json)
+        print(f"✓ Results saved to: {demo_json}")
     print()
     
     # Show sample JSON output
@@ -239,7 +319,7 @@ def main():
     print("SAMPLE JSON OUTPUT (First Article):")
     print("=" * 100)
     print()
-    print(json.dumps(results[0], indent=2, ensure_ascii=False))
+    print(dumps_indented(first_result).decode('utf-8'))
     print()
     
     print("=" * 100)
@@ -10,6 +10,7 @@
 """
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Add src to path
@@ -62,7 +63,7 @@ def main():
         keyword="artificial intelligence",  # 搜索关键词
         year=2025,                          # 筛选2025年
         max_articles=200,                   # 最多获取200篇
-        llm_delay=0.5                       # API调用延迟
+        llm_concurrency=10                  # 最多同时10个API请求（429时自动退避重试）
     )
     
     print("开始获取论文...")
@@ -70,7 +71,7 @@ def main():
     
     try:
         # 执行获取
-        results = harvester.harvest()
+        results = asyncio.run(harvester.harvest_async())
         
         # 显示结果摘要
         print()
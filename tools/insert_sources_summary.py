@@ -8,19 +8,61 @@ Behavior:
 - if a block starting with '## Sources summary' already exists at the top, replace it
 """
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 import re
 from pathlib import Path
-
-
-def compute_source_counts(lines):
-    src_re = re.compile(r"^\*\*Source:\*\*\s*(\S+)", re.IGNORECASE)
-    counts = Counter()
-    for ln in lines:
-        m = src_re.match(ln.strip())
-        if m:
-            counts[m.group(1).lower()] += 1
-    return counts
+from typing import Optional
+
+from _backup import make_backup, write_atomic
+
+# `**Source:** <value>` lines; leading whitespace is allowed so lines need no strip()
+_SOURCE_RE = re.compile(r"\s*\*\*Source:\*\*\s*(\S+)", re.IGNORECASE)
+
+
+@dataclass
+class ReportScan:
+    """Everything main() needs to know about the report, gathered in one pass."""
+    counts: Counter = field(default_factory=Counter)
+    total_headings: int = 0
+    insert_idx: int = 0                   # after the first '---' divider in the first 50 lines
+    existing_start: Optional[int] = None  # existing '## Sources summary' in the first 80 lines
+    existing_end: Optional[int] = None    # past the block's '---' (and blank line), or the next '## '
+
+
+def scan(lines) -> ReportScan:
+    result = ReportScan()
+    match = _SOURCE_RE.match
+    for i, ln in enumerate(lines):
+        is_heading = ln.startswith("## ")
+        # a substring test is far cheaper than a failed regex match, and most lines have no '*'
+        if "*" in ln:
+            m = match(ln)
+            if m:
+                result.counts[m.group(1).lower()] += 1
+
+        if result.existing_start is None:
+            if i < 80 and ln.strip().lower().startswith("## sources summary"):
+                # our own block, not an article: it is not counted as a heading
+                result.existing_start = i
+                continue
+            elif not result.insert_idx and i < 50 and ln.strip() == "---":
+                result.insert_idx = i + 1
+        elif result.existing_end is None and (is_heading or ln.strip() == "---"):
+            result.existing_end = i
+        if is_heading:
+            result.total_headings += 1
+
+    if result.existing_start is not None:
+        if result.existing_end is None:
+            result.existing_end = result.existing_start + 1
+        elif lines[result.existing_end].strip() == "---":
+            # the block's own closing divider and blank line are replaced too,
+            # so updating the block is idempotent
+            result.existing_end += 1
+            if result.existing_end < len(lines) and not lines[result.existing_end].strip():
+                result.existing_end += 1
+    return result
 
 
 def build_summary_block(total, counts):
@@ -40,6 +82,27 @@ def build_summary_block(total, counts):
     return [l + "\n" for l in lines]
 
 
+def insert_summary(lines):
+    """Return (new_lines, summary_block) with the Sources summary inserted or replaced."""
+    info = scan(lines)
+    # fallback total: count headings starting with '## ' after modifications
+    total = info.total_headings
+    summary_block = build_summary_block(total, info.counts)
+
+    # If there is an existing '## Sources summary' near the top, replace that block;
+    # otherwise insert after the first '---' divider (or at the top)
+    if info.existing_start is not None:
+        new_lines = lines[:info.existing_start] + summary_block + lines[info.existing_end:]
+    else:
+        new_lines = lines[:info.insert_idx] + summary_block + lines[info.insert_idx:]
+    return new_lines, summary_block
+
+
+def clean_text(text: str) -> str:
+    """Return text with an up-to-date Sources summary near the top."""
+    return ''.join(insert_summary(text.splitlines(keepends=True))[0])
+
+
 def main():
     repo = Path(__file__).resolve().parents[1]
     data_file = repo / "data" / "medrxiv-ai-20251101-102613.md"
@@ -50,49 +113,12 @@ def main():
     text = data_file.read_text(encoding="utf-8")
     lines = text.splitlines(keepends=True)
 
-    # make a safe backup with timestamp
-    bak = data_file.with_suffix(data_file.suffix + ".insert.bak")
-    bak.write_bytes(data_file.read_bytes())
+    # make a safe backup (stored once per content under data/backups/)
+    bak = make_backup(data_file, ".insert.bak")
     print(f"Backup created: {bak}")
 
-    counts = compute_source_counts(lines)
-    # fallback total: count headings starting with '## ' after modifications
-    total_headings = sum(1 for ln in lines if ln.startswith("## "))
-    total = total_headings
-    summary_block = build_summary_block(total, counts)
-
-    # Find first '---' divider to insert after it. If not found, insert at top.
-    insert_idx = None
-    for i, ln in enumerate(lines[:50]):
-        if ln.strip() == "---":
-            insert_idx = i + 1
-            break
-
-    if insert_idx is None:
-        insert_idx = 0
-
-    # If there is an existing '## Sources summary' near the top (first 80 lines), remove that block first
-    start = None
-    for i, ln in enumerate(lines[:80]):
-        if ln.strip().lower().startswith("## sources summary"):
-            start = i
-            break
-    end = None
-    if start is not None:
-        # find the next '---' after start or next top-level heading '## '
-        for j in range(start + 1, len(lines)):
-            if lines[j].strip() == '---' or lines[j].startswith('## '):
-                end = j
-                break
-        if end is None:
-            end = start + 1
-
-        # replace existing block
-        new_lines = lines[:start] + summary_block + lines[end:]
-    else:
-        new_lines = lines[:insert_idx] + summary_block + lines[insert_idx:]
-
-    data_file.write_text(''.join(new_lines), encoding="utf-8")
+    new_lines, summary_block = insert_summary(lines)
+    write_atomic(data_file, ''.join(new_lines).encode("utf-8"))
     print("Inserted/updated Sources summary. Preview:")
     for l in summary_block:
         print(l, end='')
@@ -9,69 +9,117 @@ Behavior:
    then remove the subsequent consecutive non-empty lines (the immediate paragraph)
    up to the next blank line. Leave the blank line for spacing.
 """
-from pathlib import Path
+import io
+import os
 import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from _backup import make_backup
+
+# States of the single-pass filter
+NORMAL = 0
+SKIP_HEADING_BLANKS = 1    # blank lines right after an '### Abstract (excerpt)' heading
+SKIP_PARAGRAPH = 2         # the paragraph that belongs to the heading
+AFTER_METRICS = 3          # blank lines after '**Metrics:**', held until the next line decides
+SKIP_METRICS_PARAGRAPH = 4  # the stray paragraph that followed '**Metrics:**'
+
+# Lines starting with these are report fields/structure, not a stray abstract paragraph
+FIELD_PREFIXES = ("**", "##", "###", "---", "URL:", "**URL:")
 
 
-def process_file(target: Path) -> int:
-    with target.open("r", encoding="utf-8") as f:
-        lines = f.readlines()
+def filter_lines(lines, write) -> int:
+    """
+    Stream lines through both cleanups in one pass, calling write() for each kept line.
 
-    # First pass: remove headings and their immediate paragraph(s)
-    new_lines = []
-    i = 0
+    Removes each '### Abstract (excerpt)' heading with its paragraph, and the
+    plain paragraph directly after a '**Metrics:**' line. Only the blank lines
+    following a '**Metrics:**' line are buffered.
+
+    Returns:
+        Number of '### Abstract (excerpt)' blocks removed
+    """
     removed_blocks = 0
-    n = len(lines)
-    while i < n:
-        line = lines[i]
-        if line.lstrip().startswith("### Abstract (excerpt)"):
-            # skip the heading
-            i += 1
-            # skip any immediate blank lines after the heading
-            while i < n and lines[i].strip() == "":
-                i += 1
-            # skip following non-empty lines (the paragraph)
-            while i < n and lines[i].strip() != "":
-                i += 1
-            # keep one blank line if there is one (for readability)
-            if i < n and lines[i].strip() == "":
-                new_lines.append("\n")
-                i += 1
-            removed_blocks += 1
-            continue
-        else:
-            new_lines.append(line)
-            i += 1
-
-    # Second pass: remove paragraph that immediately follows a '**Metrics:**' line
-    lines2 = []
-    i = 0
-    n = len(new_lines)
-    while i < n:
-        line = new_lines[i]
-        lines2.append(line)
+    state = NORMAL
+    metrics_state = NORMAL
+    pending = []
+
+    def emit(line):
+        # Second stage: drop the paragraph immediately following a '**Metrics:**' line
+        nonlocal metrics_state
+        blank = line.strip() == ""
+        if metrics_state == AFTER_METRICS:
+            if blank:
+                pending.append(line)
+                return
+            if not line.lstrip().startswith(FIELD_PREFIXES):
+                # keep one blank line for spacing, drop the paragraph
+                pending.clear()
+                write("\n")
+                metrics_state = SKIP_METRICS_PARAGRAPH
+                return
+            write("".join(pending))
+            pending.clear()
+            metrics_state = NORMAL
+        elif metrics_state == SKIP_METRICS_PARAGRAPH:
+            if not blank:
+                return
+            metrics_state = NORMAL
+        write(line)
         if line.lstrip().startswith("**Metrics:**"):
-            # look ahead: skip blank lines
-            j = i + 1
-            while j < n and new_lines[j].strip() == "":
-                j += 1
-            # if the next non-empty line exists and does NOT start with a markdown field or heading,
-            # treat it as the abstract paragraph and skip it
-            if j < n:
-                nxt = new_lines[j]
-                if not (nxt.lstrip().startswith("**") or nxt.lstrip().startswith("##") or nxt.lstrip().startswith("###") or nxt.lstrip().startswith("---") or nxt.lstrip().startswith("URL:") or nxt.lstrip().startswith("**URL:")):
-                    # remove the paragraph: skip consecutive non-empty lines starting at j
-                    k = j
-                    while k < n and new_lines[k].strip() != "":
-                        k += 1
-                    # ensure we leave one blank line for spacing
-                    lines2.append("\n")
-                    i = k
-                    continue
-        i += 1
-
-    with target.open("w", encoding="utf-8") as f:
-        f.writelines(lines2)
+            metrics_state = AFTER_METRICS
+
+    for line in lines:
+        # First stage: drop '### Abstract (excerpt)' headings and their paragraph
+        if state == NORMAL:
+            if line.lstrip().startswith("### Abstract (excerpt)"):
+                removed_blocks += 1
+                state = SKIP_HEADING_BLANKS
+            else:
+                emit(line)
+        elif line.strip() != "":
+            # any non-empty line after the heading is (part of) its paragraph
+            state = SKIP_PARAGRAPH
+        elif state == SKIP_PARAGRAPH:
+            # keep one blank line (for readability)
+            emit("\n")
+            state = NORMAL
+
+    write("".join(pending))
+    return removed_blocks
+
+
+def clean_text(text: str) -> str:
+    """Return text with the excerpt blocks removed (pure variant of process_file)."""
+    out = []
+    filter_lines(io.StringIO(text), out.append)
+    return "".join(out)
+
+
+def process_file(target: Path, data: Optional[bytes] = None) -> int:
+    """
+    Clean target in place, streaming into a temporary file that atomically replaces it.
+
+    If the caller already holds the file contents, pass them as data so the
+    file is not read a second time.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=target.parent, prefix=target.name + ".", suffix=".tmp", delete=False
+    )
+    try:
+        if data is None:
+            src = target.open("r", encoding="utf-8")
+        else:
+            # same universal-newline handling as reading the file in text mode
+            src = io.StringIO(data.decode("utf-8"), newline=None)
+        with src, tmp:
+            removed_blocks = filter_lines(src, tmp.write)
+        shutil.copymode(target, tmp.name)
+        os.replace(tmp.name, target)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
     return removed_blocks
 
@@ -83,11 +131,12 @@ def main():
         print(f"Target file not found: {target}")
         return
 
-    backup = target.with_suffix(target.suffix + ".bak")
-    shutil.copy2(target, backup)
+    # Read once; the same bytes serve the backup and the cleanup
+    data = target.read_bytes()
+    backup = make_backup(target, ".bak", data)
     print(f"Backup written to: {backup}")
 
-    removed = process_file(target)
+    removed = process_file(target, data)
     print(f"Removed {removed} '### Abstract (excerpt)' blocks from {target.name}")
 
 
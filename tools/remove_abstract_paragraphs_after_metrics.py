@@ -6,23 +6,68 @@ This targets leftover abstract excerpts that followed removed '### Abstract (exc
 Creates a backup `<file>.bak2` before writing.
 """
 from pathlib import Path
-import shutil
 import re
 
+from _backup import make_backup, write_atomic
+
+# Matches when the text has at least 10 \w+ words; anchored, so it stops at the
+# tenth word instead of collecting every word like findall
+_TEN_WORDS_RE = re.compile(r"\W*(?:\w+\W+){9}\w")
+# Blank-line paragraph separator; captured so separators are kept in the split
+_PARAGRAPH_SEP_RE = re.compile(r"(\n\s*\n)")
+
 
 def is_english_paragraph(text: str) -> bool:
-    # Heuristic: contains mainly ASCII letters/punctuation, at least 20 words, and contains sentence punctuation
-    words = re.findall(r"\w+", text)
-    if len(words) < 10:
-        return False
-    # ratio of ascii letters
-    ascii_chars = sum(1 for c in text if ord(c) < 128)
-    if ascii_chars / max(1, len(text)) < 0.7:
-        return False
+    # Heuristic: contains mainly ASCII letters/punctuation, at least 10 words, and contains sentence punctuation.
+    # Checks run cheapest first so most non-matching paragraphs are rejected early.
     # has at least one period (.) indicating sentences
     if "." not in text:
         return False
-    return True
+    # ratio of ascii letters; pure-ASCII text (the common case) skips the count,
+    # otherwise the codec counts in C rather than per character in Python
+    if not text.isascii():
+        ascii_chars = len(text.encode("ascii", "ignore"))
+        if ascii_chars / len(text) < 0.7:
+            return False
+    return _TEN_WORDS_RE.match(text) is not None
+
+
+def iter_paragraphs(text: str):
+    """
+    Iterate (paragraph, separator) pairs; joined back together they give text.
+
+    A separator is a whitespace run holding at least two newlines. The final
+    paragraph has an empty separator.
+    """
+    # One C-level split beats a Python str.find scan here: report paragraphs
+    # are mostly single lines, so a Python loop would run once per line
+    parts = _PARAGRAPH_SEP_RE.split(text)
+    parts.append("")
+    return zip(parts[::2], parts[1::2])
+
+
+def remove_paragraphs(text: str):
+    """Return (new_text, removed) with the English paragraphs after '**Metrics:**' dropped."""
+    out = []
+    removed = 0
+    after_metrics = False
+    for para, sep in iter_paragraphs(text):
+        # a paragraph right after one containing '**Metrics:**' is dropped if it looks like English prose,
+        # keeping its separator for spacing
+        if after_metrics and is_english_paragraph(para):
+            removed += 1
+            out.append(sep)
+            after_metrics = False
+            continue
+        out.append(para)
+        out.append(sep)
+        after_metrics = "**Metrics:**" in para
+    return ''.join(out), removed
+
+
+def clean_text(text: str) -> str:
+    """Return text with the English paragraphs after '**Metrics:**' dropped."""
+    return remove_paragraphs(text)[0]
 
 
 def main():
@@ -32,41 +77,12 @@ def main():
         print(f"Target not found: {target}")
         return
 
-    backup = target.with_suffix(target.suffix + ".bak2")
-    shutil.copy2(target, backup)
+    backup = make_backup(target, ".bak2")
     print(f"Backup written to: {backup}")
 
-    text = target.read_text(encoding="utf-8")
-    # split into paragraphs (preserve blank line boundaries)
-    paragraphs = re.split(r"(\n\s*\n)", text)
-
-    # paragraphs list alternates between content and separator due to split capturing
-    out = []
-    removed = 0
-    i = 0
-    while i < len(paragraphs):
-        part = paragraphs[i]
-        out.append(part)
-        # if this part contains '**Metrics:**', check the next content paragraph
-        if "**Metrics:**" in part:
-            # next item is separator (if any) then next content; find next non-separator index
-            j = i + 1
-            # ensure we have a separator and a following paragraph
-            if j + 1 < len(paragraphs):
-                sep = paragraphs[j]
-                next_para = paragraphs[j+1]
-                # check heuristics on next_para
-                if is_english_paragraph(next_para):
-                    removed += 1
-                    # skip the separator and next_para by advancing i
-                    # but preserve a single separator for spacing
-                    out.append(sep)
-                    i = j + 2
-                    continue
-        i += 1
-
+    text, removed = remove_paragraphs(target.read_text(encoding="utf-8"))
     if removed:
-        target.write_text(''.join(out), encoding="utf-8")
+        write_atomic(target, text.encode("utf-8"))
     print(f"Removed {removed} english-like paragraphs after '**Metrics:**'")
 
 
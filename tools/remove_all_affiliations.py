@@ -4,9 +4,20 @@ Backup and remove lines starting with "**All Affiliations:**" from the target ma
 
 Usage: run from repository root (script uses relative path to data file).
 """
-import shutil
+import re
 from pathlib import Path
 
+from _backup import make_backup, write_atomic
+
+# A whole "**All Affiliations:**" line, newline included. Matched on str so the
+# indentation may be any Unicode whitespace (NBSP, ideographic space), as lstrip() allows
+ALL_AFFILIATIONS_RE = re.compile(r"(?m)^[^\S\n]*\*\*All Affiliations:\*\*[^\n]*\n?")
+
+
+def clean_text(text: str) -> str:
+    """Return text without its '**All Affiliations:**' lines."""
+    return ALL_AFFILIATIONS_RE.sub("", text)
+
 
 def main():
     # script is in <repo>/tools/, so parents[1] is repo root
@@ -16,24 +27,14 @@ def main():
         print(f"Target file not found: {target}")
         return
 
-    backup = target.with_suffix(target.suffix + ".bak")
-    shutil.copy2(target, backup)
+    # Read once; the same bytes serve the backup and the cleanup
+    data = target.read_bytes()
+    backup = make_backup(target, ".bak", data)
     print(f"Backup written to: {backup}")
 
-    with target.open("r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    new_lines = []
-    removed_count = 0
-    for line in lines:
-        # strip left whitespace then check
-        if line.lstrip().startswith("**All Affiliations:**"):
-            removed_count += 1
-            continue
-        new_lines.append(line)
-
-    with target.open("w", encoding="utf-8") as f:
-        f.writelines(new_lines)
+    # One C-level regex sweep over the text instead of a Python loop over lines
+    new_text, removed_count = ALL_AFFILIATIONS_RE.subn("", data.decode("utf-8"))
+    write_atomic(target, new_text.encode("utf-8"))
 
     print(f"Removed {removed_count} lines starting with '**All Affiliations:**' from {target.name}")
 
@@ -8,35 +8,75 @@ Behavior:
    there is no following non-empty paragraph (before the next field starting with '**' or a heading), consider it empty.
  - Remove the entire article block if AI Role is empty. Create a backup with suffix '.bak3'.
 """
-from pathlib import Path
+import io
+import os
 import shutil
-import re
-
-
-def is_ai_role_empty(block_lines):
-    # Find the AI Role line
-    for idx, line in enumerate(block_lines):
-        if line.lstrip().startswith("**AI Role:**"):
-            # Check same-line content after colon
-            after = line.split("**AI Role:**", 1)[1]
-            if after.strip():
-                return False
-            # look ahead for next non-empty, non-field line
-            j = idx + 1
-            while j < len(block_lines):
-                nxt = block_lines[j].rstrip("\n")
-                if nxt.strip() == "":
-                    j += 1
-                    continue
-                # if next non-empty starts with '**' or '##' or '###' -> it's a field/heading not content
-                if nxt.lstrip().startswith("**") or nxt.lstrip().startswith("##") or nxt.lstrip().startswith("###"):
-                    return True
-                # otherwise it's content text -> not empty
-                return False
-            # reached end without finding content
-            return True
-    # if no AI Role field found, treat as non-empty (do not delete)
-    return False
+import tempfile
+from pathlib import Path
+
+from _backup import make_backup
+
+# States of the article block being streamed
+UNDECIDED = 0  # no '**AI Role:**' line seen yet
+LOOKAHEAD = 1  # '**AI Role:**' line had no content; the next non-empty line decides
+KEEP = 2
+DROP = 3
+
+
+def filter_articles(lines, write) -> int:
+    """
+    Stream lines in one pass, calling write() for each line that is kept.
+
+    Each article is decided inline as its lines arrive: it is dropped when its
+    '**AI Role:**' line has no content and the next non-empty line is another
+    field or heading (or the article ends first). Lines are buffered only
+    until that decision is made.
+
+    Returns:
+        Number of articles removed
+    """
+    removed = 0
+    state = KEEP  # content before the first article is always kept
+    pending = []
+
+    for line in lines:
+        if line.startswith("## "):
+            # close the previous article
+            if state in (LOOKAHEAD, DROP):
+                removed += 1
+            else:
+                # no AI Role field found -> treat as non-empty (do not delete)
+                write("".join(pending))
+            pending.clear()
+            state = UNDECIDED
+        elif state == UNDECIDED:
+            stripped = line.lstrip()
+            if stripped.startswith("**AI Role:**"):
+                # same-line content after the colon means the role is filled in
+                state = KEEP if line.split("**AI Role:**", 1)[1].strip() else LOOKAHEAD
+        elif state == LOOKAHEAD and line.strip() != "":
+            # a field/heading means no content; anything else is the role text
+            state = DROP if line.lstrip().startswith(("**", "##")) else KEEP
+
+        if state == KEEP:
+            write("".join(pending))
+            pending.clear()
+            write(line)
+        elif state != DROP:
+            pending.append(line)
+
+    if state in (LOOKAHEAD, DROP):
+        removed += 1
+    else:
+        write("".join(pending))
+    return removed
+
+
+def clean_text(text: str) -> str:
+    """Return text without the articles whose '**AI Role:**' is empty."""
+    out = []
+    filter_articles(io.StringIO(text), out.append)
+    return "".join(out)
 
 
 def main():
@@ -46,43 +86,21 @@ def main():
         print(f"Target file not found: {target}")
         return
 
-    backup = target.with_suffix(target.suffix + ".bak3")
-    shutil.copy2(target, backup)
+    backup = make_backup(target, ".bak3")
     print(f"Backup written to: {backup}")
 
-    text = target.read_text(encoding="utf-8")
-    lines = text.splitlines(keepends=True)
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=target.parent, prefix=target.name + ".", suffix=".tmp", delete=False
+    )
+    try:
+        with target.open("r", encoding="utf-8") as src, tmp:
+            removed_count = filter_articles(src, tmp.write)
+        shutil.copymode(target, tmp.name)
+        os.replace(tmp.name, target)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
-    articles = []  # list of (start_idx, end_idx) for article blocks
-    current_start = None
-    for i, line in enumerate(lines):
-        if line.startswith("## "):
-            if current_start is not None:
-                articles.append((current_start, i))
-            current_start = i
-    if current_start is not None:
-        articles.append((current_start, len(lines)))
-
-    to_keep = []
-    removed_count = 0
-    last = 0
-    for (s, e) in articles:
-        # append content before this article
-        if last < s:
-            to_keep.extend(lines[last:s])
-        block = lines[s:e]
-        if is_ai_role_empty(block):
-            removed_count += 1
-            # skip this block (do not add to to_keep)
-        else:
-            to_keep.extend(block)
-        last = e
-
-    # append any trailing content after last article
-    if last < len(lines):
-        to_keep.extend(lines[last:])
-
-    target.write_text(''.join(to_keep), encoding="utf-8")
     print(f"Removed {removed_count} articles with empty '**AI Role:**'")
 
 
@@ -5,35 +5,80 @@ Renumber article headings in the medrxiv markdown file.
 Find lines that start with '##' and an existing numeric prefix like '## 12.' and
 replace the number with a sequential index starting at 1 in order of appearance.
 
-Creates a backup with suffix '.renumber.bak'.
+Creates a backup with suffix '.renumber.bak' (only when a heading number changes).
 """
 from pathlib import Path
-import shutil
+from typing import Optional
+import mmap
+import os
 import re
+import shutil
+import tempfile
+
+from _backup import replace_with_backup
+
+# Numbered article heading at a line start, matched on the raw bytes; horizontal
+# whitespace only, so a match never spans lines
+HEADER_RE = re.compile(rb'(?m)^(##[^\S\n]*)(\d+)(\.[^\S\n]*)')
+
 
+def changed_numbers(buf):
+    """
+    Yield (start, end, new_number) for each heading number that is out of sequence.
 
-def renumber_file(path: Path) -> int:
-    text = path.read_text(encoding="utf-8")
-    lines = text.splitlines(keepends=True)
+    buf is any bytes-like object (bytes or an mmap); start/end delimit the digits.
+    """
+    for count, m in enumerate(HEADER_RE.finditer(buf), 1):
+        # format the number once; the same bytes serve the comparison and the patch
+        # (a bytes compare of the digits beats int() parsing and also catches '## 01.')
+        number = b"%d" % count
+        if m[2] != number:
+            start, end = m.span(2)
+            yield start, end, number
 
-    count = 0
-    changed = 0
-    out = []
-    header_re = re.compile(r'^(##\s*)(\d+)\.(\s*)')
-    for line in lines:
-        m = header_re.match(line)
-        if m:
-            count += 1
-            prefix, oldnum, sep = m.group(1), m.group(2), m.group(3)
-            new_line = f"{prefix}{count}.{sep}" + line[m.end():]
-            out.append(new_line)
-            if oldnum != str(count):
-                changed += 1
-        else:
-            out.append(line)
 
-    path.write_text(''.join(out), encoding="utf-8")
-    return changed
+def renumber_file(path: Path, backup_suffix: Optional[str] = None) -> int:
+    """
+    Renumber the headings of path in place.
+
+    The file is memory-mapped and only the changed digits are patched while the
+    rest is copied through to a temporary file, which then replaces path.
+
+    Args:
+        path: Markdown file to renumber
+        backup_suffix: If given, keep the old contents under this suffix once the
+            rewrite has succeeded
+
+    Returns:
+        Number of headings whose number changed (0 means path was left untouched)
+    """
+    if path.stat().st_size == 0:  # mmap cannot map an empty file
+        return 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        edits = list(changed_numbers(mm))
+        if not edits:
+            return 0
+        tmp = tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                prev = 0
+                for start, end, number in edits:
+                    tmp.write(mm[prev:start])
+                    tmp.write(number)
+                    prev = end
+                tmp.write(mm[prev:])
+            shutil.copymode(path, tmp.name)
+            if backup_suffix is None:
+                os.replace(tmp.name, path)
+            else:
+                # the replaced inode becomes the backup: no data is copied
+                replace_with_backup(tmp.name, path, backup_suffix, mm)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+    return len(edits)
 
 
 def main():
@@ -43,11 +88,13 @@ def main():
         print(f"Target not found: {target}")
         return
 
-    backup = target.with_suffix(target.suffix + ".renumber.bak")
-    shutil.copy2(target, backup)
-    print(f"Backup created: {backup}")
+    backup_suffix = ".renumber.bak"
+    changed = renumber_file(target, backup_suffix)
+    if not changed:
+        print("Headings already sequential; file left untouched (no backup needed)")
+        return
 
-    changed = renumber_file(target)
+    print(f"Backup created: {target.with_name(target.name + backup_suffix)}")
     print(f"Renumbered headings; {changed} headings updated to sequential numbers")
 
 
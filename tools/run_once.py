@@ -47,27 +47,32 @@ try:
     required_vars = ['GLM_API_KEY']
     optional_vars = ['OPENAI_API_KEY', 'BIO_MODEL_API_KEY', 'BIO_MODEL_BASE_URL']
     
+    # One snapshot of the environment (taken after .env is loaded) serves every check below
+    env = dict(os.environ)
+    missing_required = []
+    
     print("Environment Check:")
     for var in required_vars:
-        value = os.getenv(var)
-        status = "✓ Set" if value else "✗ NOT SET (REQUIRED)"
+        if env.get(var):
+            status = "✓ Set"
+        else:
+            status = "✗ NOT SET (REQUIRED)"
+            missing_required.append(var)
         print(f"  {var}: {status}")
     
     for var in optional_vars:
-        value = os.getenv(var)
-        status = "✓ Set" if value else "○ Not set (optional)"
+        status = "✓ Set" if env.get(var) else "○ Not set (optional)"
         print(f"  {var}: {status}")
     
     print()
     print("Configuration:")
-    keyword = os.getenv('SEARCH_KEYWORD', 'artificial intelligence')
-    days = os.getenv('DAYS_BACK', '30')
+    keyword = env.get('SEARCH_KEYWORD', 'artificial intelligence')
+    days = env.get('DAYS_BACK', '30')
     print(f"  SEARCH_KEYWORD: {keyword}")
     print(f"  DAYS_BACK: {days}")
     print()
     
-    # Check if required vars are set
-    missing_required = [var for var in required_vars if not os.getenv(var)]
+    # Stop if required vars are missing
     if missing_required:
         print(f"ERROR: Required environment variables missing: {', '.join(missing_required)}")
         print("Please set them in .env file or as environment variables")